@@ -0,0 +1,316 @@
+import math
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.file_manager import FileManager, OperationLog, VacancyIndex
+from src.salary_index import parse_salary, salary_midpoint
+
+GroupKey = Callable[[Dict], Iterable[str]]
+# Вклад вакансии в агрегаты: группы и нормализованная середина вилки
+Contribution = Tuple[List[str], float]
+
+
+def group_by_title(vacancy: Dict) -> List[str]:
+    """Группирует вакансии по названию (без учета регистра и лишних пробелов)."""
+    title = " ".join(str(vacancy.get("title") or "").lower().split())
+    return [title] if title else []
+
+
+def group_by_keywords(keywords: Iterable[str]) -> GroupKey:
+    """Создает функцию группировки по ключевым словам в названии и описании.
+
+    Вакансия попадает во все группы, ключевые слова которых в ней встречаются.
+    """
+    words = [keyword.lower() for keyword in keywords]
+
+    def group_key(vacancy: Dict) -> List[str]:
+        text = f"{vacancy.get('title') or ''} {vacancy.get('description') or ''}".lower()
+        return [word for word in words if word in text]
+
+    return group_key
+
+
+class QuantileSketch:
+    """Объединяемый скетч квантилей с логарифмическими корзинами и гарантированной относительной точностью.
+
+    Поддерживает удаление значений, поэтому статистика остается точной при удалении вакансий.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """Инициализация скетча с заданной относительной точностью квантилей."""
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy должна быть в интервале (0, 1)")
+        self.relative_accuracy = relative_accuracy
+        self.__gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.__log_gamma = math.log(self.__gamma)
+        self.__buckets: Dict[int, int] = {}
+        self.__count = 0
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Добавляет положительное значение в скетч."""
+        if value <= 0:
+            raise ValueError("Скетч хранит только положительные значения")
+        key = self._key(value)
+        self.__buckets[key] = self.__buckets.get(key, 0) + count
+        self.__count += count
+
+    def remove(self, value: float, count: int = 1) -> None:
+        """Удаляет ранее добавленное значение из скетча."""
+        key = self._key(value)
+        remaining = self.__buckets.get(key, 0) - count
+        if remaining < 0:
+            raise ValueError(f"Значение {value} не было добавлено в скетч")
+        if remaining:
+            self.__buckets[key] = remaining
+        else:
+            del self.__buckets[key]
+        self.__count -= count
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Объединяет другой скетч с той же точностью с текущим."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Нельзя объединить скетчи с разной точностью")
+        for key, count in other.__buckets.items():
+            self.__buckets[key] = self.__buckets.get(key, 0) + count
+        self.__count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Оценка квантиля q (от 0 до 1). None - скетч пуст."""
+        if not 0 <= q <= 1:
+            raise ValueError("Квантиль должен быть в интервале [0, 1]")
+        if not self.__count:
+            return None
+        rank = q * (self.__count - 1)
+        seen = 0
+        for key in sorted(self.__buckets):
+            seen += self.__buckets[key]
+            if seen > rank:
+                return 2 * self.__gamma**key / (self.__gamma + 1)
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Преобразует скетч в словарь для сохранения в JSON."""
+        return {"relative_accuracy": self.relative_accuracy, "buckets": [[k, c] for k, c in self.__buckets.items()]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """Создает скетч из словаря, полученного методом to_dict."""
+        sketch = cls(data["relative_accuracy"])
+        for key, count in data["buckets"]:
+            sketch.__buckets[key] = count
+            sketch.__count += count
+        return sketch
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self.__log_gamma)
+
+
+class SalaryAggregates(VacancyIndex):
+    """Инкрементально обновляемые агрегаты зарплат по группам вакансий.
+
+    Для каждой группы хранятся количество, сумма и скетч квантилей нормализованной середины вилки.
+    Агрегаты обновляются при добавлении и удалении вакансий в хранилище, поэтому отчет строится
+    за O(число групп) без чтения всех вакансий.
+    Файл агрегатов - журнал JSON Lines: снимок агрегатов групп, за которым дописываются изменения групп;
+    снимок переписывается только при сжатии журнала или вызове flush().
+    Вклады отдельных вакансий (нужны только для удаления и замены) дописываются в отдельный журнал
+    и загружаются лишь при первом изменении агрегатов.
+    """
+
+    CONTRIBUTIONS_SUFFIX = ".contributions.jsonl"
+
+    def __init__(
+        self, filename: Optional[str] = None, group_by: GroupKey = group_by_title, relative_accuracy: float = 0.01
+    ):
+        """Инициализация агрегатов. Если файл агрегатов уже существует, загружаются только агрегаты групп."""
+        self.__filename = filename
+        self.__group_by = group_by
+        self.__relative_accuracy = relative_accuracy
+        self.__groups: Dict[str, Dict[str, Any]] = {}
+        self.__contributions: Optional[Dict[str, Contribution]] = None if filename else {}
+        self.__groups_log = OperationLog(filename, self._groups_snapshot) if filename else None
+        self.__log = OperationLog(filename + self.CONTRIBUTIONS_SUFFIX, self._snapshot) if filename else None
+        if self.__groups_log is not None and os.path.exists(self.__groups_log.filename):
+            self._load(self.__groups_log)
+
+    @property
+    def filename(self) -> Optional[str]:
+        return self.__filename
+
+    @property
+    def contributions_filename(self) -> Optional[str]:
+        return self.__filename + self.CONTRIBUTIONS_SUFFIX if self.__filename else None
+
+    @property
+    def groups(self) -> List[str]:
+        return list(self.__groups)
+
+    def __len__(self) -> int:
+        return len(self._contributions())
+
+    def add(self, vacancy: Dict) -> None:
+        """Учитывает вакансию в агрегатах (повторное добавление того же id заменяет вклад)."""
+        vacancy_id = vacancy.get("url")
+        if not vacancy_id:
+            return
+        removed = self._remove(vacancy_id)
+        added = self._add(vacancy_id, vacancy)
+        self._log_change(vacancy_id, removed, added)
+
+    def remove(self, vacancy_id: str) -> None:
+        """Исключает вакансию из агрегатов."""
+        removed = self._remove(vacancy_id)
+        if removed is not None:
+            self._log_change(vacancy_id, removed, None)
+
+    def clear(self) -> None:
+        """Очищает агрегаты."""
+        self.__groups = {}
+        self.__contributions = {}
+        self.save()
+
+    def rebuild(self, vacancies: Iterable[Dict]) -> None:
+        """Пересчитывает агрегаты по всем вакансиям хранилища (например, после смены группировки)."""
+        self.__groups = {}
+        self.__contributions = {}
+        for vacancy in vacancies:
+            vacancy_id = vacancy.get("url")
+            if vacancy_id:
+                self._remove(vacancy_id)
+                self._add(vacancy_id, vacancy)
+        self.save()
+
+    def attach(self, file_manager: FileManager) -> None:
+        """Пересчитывает агрегаты, если количество учтенных вакансий не совпадает с количеством в хранилище."""
+        if len(self) != file_manager.count_vacancies():
+            self.rebuild(file_manager.iter_vacancies())
+
+    def stats(self, group: str, quantiles: Iterable[float] = (0.5, 0.9)) -> Optional[Dict[str, Any]]:
+        """Статистика по группе: количество, среднее и квантили зарплаты. None - группы нет."""
+        data = self.__groups.get(group)
+        if data is None:
+            return None
+        sketch: QuantileSketch = data["sketch"]
+        result: Dict[str, Any] = {"count": data["count"], "mean": data["total"] / data["count"]}
+        for q in quantiles:
+            result[f"p{round(q * 100)}"] = sketch.quantile(q)
+        return result
+
+    def report(self, quantiles: Iterable[float] = (0.5, 0.9)) -> Dict[str, Dict[str, Any]]:
+        """Статистика по всем группам."""
+        quantiles = tuple(quantiles)
+        report = {}
+        for group in self.__groups:
+            stats = self.stats(group, quantiles)
+            if stats is not None:
+                report[group] = stats
+        return report
+
+    def flush(self) -> None:
+        """Переписывает файл агрегатов снимком агрегатов групп без накопленных изменений (если файл задан)."""
+        if self.__groups_log is not None:
+            self.__groups_log.compact()
+
+    def save(self) -> None:
+        """Сохраняет агрегаты групп и переписывает журнал вкладов текущим состоянием (если файл задан)."""
+        self.flush()
+        if self.__log is not None:
+            self.__log.compact()
+
+    def _log_change(self, vacancy_id: str, removed: Optional[Contribution], added: Optional[Contribution]) -> None:
+        """Дописывает изменения групп в файл агрегатов и новый вклад вакансии в журнал вкладов."""
+        if self.__groups_log is None or self.__log is None:
+            return
+        deltas = []
+        for contribution, sign in ((removed, -1), (added, 1)):
+            if contribution is not None and contribution[0]:
+                deltas.append({"groups": contribution[0], "value": contribution[1], "sign": sign})
+        if deltas:
+            self.__groups_log.append(deltas, live=len(self.__groups))
+        record: Dict[str, Any] = {"id": vacancy_id}
+        if added is not None:
+            record.update(groups=added[0], value=added[1])
+        self.__log.append([record], live=len(self._contributions()))
+
+    def _groups_snapshot(self) -> Iterator[Dict[str, Any]]:
+        """Записи файла агрегатов, описывающие текущее состояние: точность скетчей, затем агрегаты каждой группы."""
+        yield {"relative_accuracy": self.__relative_accuracy}
+        for group, g in self.__groups.items():
+            yield {"group": group, "count": g["count"], "total": g["total"], "sketch": g["sketch"].to_dict()}
+
+    def _snapshot(self) -> Iterator[Dict[str, Any]]:
+        """Записи журнала вкладов, описывающие текущее состояние."""
+        for vacancy_id, (groups, value) in self._contributions().items():
+            yield {"id": vacancy_id, "groups": groups, "value": value}
+
+    def _contributions(self) -> Dict[str, Contribution]:
+        """Вклады вакансий в группы. При первом обращении загружаются из журнала."""
+        if self.__contributions is None:
+            self.__contributions = {}
+            for record in self.__log.replay() if self.__log is not None else ():
+                try:
+                    if "groups" in record:
+                        self.__contributions[record["id"]] = (record["groups"], record["value"])
+                    else:
+                        self.__contributions.pop(record["id"], None)
+                except (KeyError, TypeError):
+                    continue
+        return self.__contributions
+
+    def _load(self, log: OperationLog) -> None:
+        """Загружает агрегаты групп: снимок и дописанные после него изменения. Поврежденные строки пропускаются."""
+        for record in log.replay():
+            try:
+                if "sign" in record:
+                    self._apply(record["groups"], record["value"], record["sign"])
+                elif "group" in record:
+                    self.__groups[record["group"]] = self._group_from_dict(record)
+                elif "relative_accuracy" in record:
+                    self.__relative_accuracy = record["relative_accuracy"]
+                    # Файл агрегатов в прежнем формате - один JSON-объект со всеми группами
+                    for group, g in record.get("groups", {}).items():
+                        self.__groups[group] = self._group_from_dict(g)
+            except (KeyError, TypeError, ValueError, AttributeError):
+                continue
+
+    @staticmethod
+    def _group_from_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+        return {"count": data["count"], "total": data["total"], "sketch": QuantileSketch.from_dict(data["sketch"])}
+
+    def _apply(self, groups: List[str], value: float, sign: int) -> None:
+        """Добавляет значение в агрегаты групп (sign=1) или исключает его из них (sign=-1)."""
+        for group in groups:
+            if sign > 0:
+                data = self.__groups.setdefault(
+                    group, {"count": 0, "total": 0.0, "sketch": QuantileSketch(self.__relative_accuracy)}
+                )
+                data["count"] += 1
+                data["total"] += value
+                data["sketch"].add(value)
+            else:
+                data = self.__groups[group]
+                data["count"] -= 1
+                data["total"] -= value
+                data["sketch"].remove(value)
+                if not data["count"]:
+                    del self.__groups[group]
+
+    def _add(self, vacancy_id: str, vacancy: Dict) -> Contribution:
+        """Учитывает вакансию в агрегатах. Вакансия без зарплаты или групп запоминается с пустым вкладом."""
+        value = salary_midpoint(parse_salary(vacancy.get("salary_from")), parse_salary(vacancy.get("salary_to")))
+        groups = list(dict.fromkeys(self.__group_by(vacancy))) if value is not None else []
+        contribution: Contribution = (groups, value or 0.0)
+        self._apply(*contribution, sign=1)
+        self._contributions()[vacancy_id] = contribution
+        return contribution
+
+    def _remove(self, vacancy_id: str) -> Optional[Contribution]:
+        """Исключает вклад вакансии из агрегатов. Возвращает исключенный вклад (None - вакансии нет)."""
+        contribution = self._contributions().pop(vacancy_id, None)
+        if contribution is not None:
+            self._apply(*contribution, sign=-1)
+        return contribution
@@ -1,8 +1,13 @@
 import abc
+import threading
+import time
 from typing import Any, Dict, Optional
 
 import requests
 
+# HTTP-статусы, при которых запрос имеет смысл повторить
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
 
 class APIClient(abc.ABC):
     """Абстрактный класс для работы с API сервисов с вакансиями."""
@@ -26,10 +31,30 @@ class APIClient(abc.ABC):
 class HeadHunterAPI(APIClient):
     """Класс для работы с API hh.ru."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        base_url: str = "https://api.hh.ru",
+        max_retries: int = 0,
+        backoff: float = 0.5,
+        timeout: Optional[float] = None,
+        max_delay: float = 60.0,
+    ) -> None:
+        """Инициализация клиента. base_url позволяет направить запросы на тестовый сервер,
+        max_retries - количество повторов при ответах 429/5xx и ошибках соединения,
+        max_delay - максимальная пауза перед повтором в секундах (в том числе из Retry-After)."""
         super().__init__()
-        self.__base_url = "https://api.hh.ru"
+        self.__base_url = base_url.rstrip("/")
         self.__headers = {"User-Agent": self._create_user_agent()}
+        self.__max_retries = max_retries
+        self.__backoff = backoff
+        self.__timeout = timeout
+        self.__max_delay = max_delay
+        self.__retry_lock = threading.Lock()
+        self.retry_count = 0
+
+    @property
+    def base_url(self) -> str:
+        return self.__base_url
 
     def _create_user_agent(self) -> str:
         """Создает User-Agent строку."""
@@ -69,17 +94,41 @@ class HeadHunterAPI(APIClient):
             "page": page,
             "per_page": 100,  # Максимальное количество вакансий на странице
         }
+        for attempt in range(self.__max_retries + 1):
+            can_retry = attempt < self.__max_retries
+            try:
+                response = requests.get(
+                    url, params=params, headers=self.__headers, timeout=self.__timeout  # type: ignore
+                )
+                if response.status_code in RETRY_STATUSES and can_retry:
+                    self._wait_before_retry(attempt, response.headers.get("Retry-After"))
+                    continue
+                response.raise_for_status()
+                data: Dict[str, Any] = response.json()
+                if "items" not in data:
+                    print("Ключ 'items' не найден в ответе API.")  # Выводим сообщение об ошибке
+                    return data  # Возвращаем  data
+                return data
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if can_retry:
+                    self._wait_before_retry(attempt)
+                    continue
+                print(f"Ошибка при получении вакансий от hh.ru: {e}")
+                return None
+            except requests.exceptions.RequestException as e:
+                print(f"Ошибка при получении вакансий от hh.ru: {e}")
+                return None
+        return None
+
+    def _wait_before_retry(self, attempt: int, retry_after: Optional[str] = None) -> None:
+        """Ждет перед повтором запроса: Retry-After из ответа или экспоненциальная задержка, но не больше max_delay."""
+        with self.__retry_lock:
+            self.retry_count += 1
         try:
-            response = requests.get(url, params=params, headers=self.__headers)  # type: ignore
-            response.raise_for_status()
-            data: Dict[str, Any] = response.json()
-            if "items" not in data:
-                print("Ключ 'items' не найден в ответе API.")  # Выводим сообщение об ошибке
-                return data  # Возвращаем  data
-            return data
-        except requests.exceptions.RequestException as e:
-            print(f"Ошибка при получении вакансий от hh.ru: {e}")
-            return None
+            delay = float(retry_after) if retry_after is not None else self.__backoff * 2**attempt
+        except (TypeError, ValueError):
+            delay = self.__backoff * 2**attempt
+        time.sleep(min(max(delay, 0.0), self.__max_delay))
 
 
 class MockHeadHunterAPI:
@@ -0,0 +1,243 @@
+import os
+import random
+import re
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.file_manager import OperationLog, VacancyIndex
+from src.vacancy import Vacancy
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_TAG_RE = re.compile(r"<[^>]+>")
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def normalize_text(text: str) -> str:
+    """Нормализует текст для сравнения: убирает HTML-теги (например <highlighttext>), регистр и пунктуацию."""
+    return " ".join(_NON_WORD_RE.sub(" ", _TAG_RE.sub(" ", text).lower()).split())
+
+
+def shingles(text: str, size: int = 5) -> Set[int]:
+    """Возвращает хеши символьных k-грамм (шинглов) нормализованного текста."""
+    text = normalize_text(text)
+    if not text:
+        return set()
+    if len(text) <= size:
+        return {zlib.crc32(text.encode("utf-8"))}
+    return {zlib.crc32(text[i : i + size].encode("utf-8")) for i in range(len(text) - size + 1)}
+
+
+def choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """Подбирает число полос и строк в полосе LSH: порог срабатывания (1/b)^(1/r) - наибольший, не выше threshold.
+
+    Порог выше threshold терял бы пары, похожие чуть больше threshold, а лишних кандидатов
+    отсеивает проверка сходства сигнатур, поэтому порог выбирается с запасом вниз.
+    """
+    best = (num_perm, 1)
+    best_cutoff = 0.0
+    for bands in range(1, num_perm + 1):
+        if num_perm % bands:
+            continue
+        rows = num_perm // bands
+        cutoff = (1 / bands) ** (1 / rows)
+        if best_cutoff < cutoff <= threshold:
+            best, best_cutoff = (bands, rows), cutoff
+    return best
+
+
+class NearDuplicateDetector(VacancyIndex):
+    """Поиск почти одинаковых вакансий с помощью MinHash-сигнатур и LSH.
+
+    Для названия и описания вакансии строится MinHash-сигнатура, которая разбивается на полосы;
+    кандидатами в дубликаты считаются только вакансии, совпавшие хотя бы в одной полосе, поэтому
+    добавление вакансии не требует сравнения со всем архивом. Каждой вакансии назначается id кластера:
+    id кластера самой похожей найденной вакансии или собственный url, если похожих нет.
+
+    Файл детектора - журнал JSON Lines: первая строка хранит параметры, добавление и удаление вакансии
+    дописывают одну строку, а разросшийся журнал периодически переписывается текущим состоянием.
+    """
+
+    def __init__(
+        self,
+        filename: Optional[str] = None,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        shingle_size: int = 5,
+        seed: int = 1,
+    ):
+        """Инициализация детектора. Если файл с сигнатурами уже существует, он загружается."""
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold должен быть в интервале (0, 1]")
+        self.__filename = filename
+        self.threshold = threshold
+        self.__num_perm = num_perm
+        self.__shingle_size = shingle_size
+        self.__bands, self.__rows = choose_bands(num_perm, threshold)
+        rng = random.Random(seed)
+        self.__permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+        self.__signatures: Dict[str, List[int]] = {}
+        self.__clusters: Dict[str, str] = {}
+        self.__buckets: Dict[Tuple[int, int], List[str]] = {}
+        self.__log = OperationLog(filename, self._snapshot) if filename else None
+        if self.__log is not None and os.path.exists(self.__log.filename):
+            self._load(self.__log)
+
+    @property
+    def filename(self) -> Optional[str]:
+        return self.__filename
+
+    def __len__(self) -> int:
+        return len(self.__clusters)
+
+    def signature(self, vacancy: Dict) -> Optional[List[int]]:
+        """MinHash-сигнатура названия и описания вакансии (None - текста нет)."""
+        text = f"{vacancy.get('title') or ''} {vacancy.get('description') or ''}"
+        hashes = shingles(text, self.__shingle_size)
+        if not hashes:
+            return None
+        return [min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes) for a, b in self.__permutations]
+
+    def find_duplicates(self, vacancy: Dict) -> List[Tuple[str, float]]:
+        """Находит сохраненные вакансии, похожие на данную не меньше порога: (id, оценка сходства)."""
+        signature = self.signature(vacancy)
+        if signature is None:
+            return []
+        return self._similar(signature, exclude=vacancy.get("url"))
+
+    def cluster_id(self, vacancy_id: str) -> Optional[str]:
+        """Id кластера вакансии (None - вакансия не добавлена)."""
+        return self.__clusters.get(vacancy_id)
+
+    def clusters(self) -> Dict[str, List[str]]:
+        """Кластеры почти одинаковых вакансий: id кластера -> id вакансий."""
+        result: Dict[str, List[str]] = {}
+        for vacancy_id, cluster in self.__clusters.items():
+            result.setdefault(cluster, []).append(vacancy_id)
+        return result
+
+    def add(self, vacancy: Dict) -> None:
+        """Добавляет вакансию и назначает ей кластер."""
+        vacancy_id = vacancy.get("url")
+        if vacancy_id and self._add(vacancy):
+            record = {"id": vacancy_id, "cluster": self.__clusters[vacancy_id]}
+            self._log({**record, "signature": self.__signatures.get(vacancy_id)})
+
+    def remove(self, vacancy_id: str) -> None:
+        """Удаляет вакансию из детектора."""
+        if self._remove(vacancy_id):
+            self._log({"id": vacancy_id})
+
+    def clear(self) -> None:
+        """Очищает детектор."""
+        self.__signatures = {}
+        self.__clusters = {}
+        self.__buckets = {}
+        self.save()
+
+    def save(self) -> None:
+        """Сохраняет параметры, сигнатуры и кластеры в файл (если он задан), заменяя журнал текущим состоянием."""
+        if self.__log is not None:
+            self.__log.compact()
+
+    def _snapshot(self) -> Iterator[Dict[str, Any]]:
+        """Записи журнала, описывающие текущее состояние: параметры, затем кластер и сигнатура каждой вакансии."""
+        yield {"params": self._params()}
+        for vacancy_id, cluster in self.__clusters.items():
+            yield {"id": vacancy_id, "cluster": cluster, "signature": self.__signatures.get(vacancy_id)}
+
+    def _log(self, record: Dict[str, Any]) -> None:
+        """Дописывает изменение в журнал (если файл задан)."""
+        if self.__log is not None:
+            self.__log.append([record], live=len(self.__clusters))
+
+    def _params(self) -> Dict[str, Any]:
+        return {"threshold": self.threshold, "num_perm": self.__num_perm, "shingle_size": self.__shingle_size}
+
+    def _load(self, log: OperationLog) -> None:
+        """Загружает сигнатуры и кластеры из журнала. Поврежденные строки пропускаются."""
+        for record in log.replay():
+            if not isinstance(record, dict):
+                continue
+            if "params" in record:
+                if record["params"] != self._params():
+                    raise ValueError(f"Файл {self.__filename} создан с другими параметрами: {record['params']}")
+                continue
+            vacancy_id = record.get("id")
+            if not isinstance(vacancy_id, str):
+                continue
+            self._remove(vacancy_id)
+            if "cluster" in record:
+                self._store(vacancy_id, record["cluster"], record.get("signature"))
+
+    def _band_keys(self, signature: List[int]) -> List[Tuple[int, int]]:
+        """Ключи корзин LSH: (номер полосы, хеш значений сигнатуры в полосе)."""
+        rows = self.__rows
+        return [(band, hash(tuple(signature[band * rows : (band + 1) * rows]))) for band in range(self.__bands)]
+
+    def _similar(self, signature: List[int], exclude: Optional[str] = None) -> List[Tuple[str, float]]:
+        """Кандидаты из корзин LSH, у которых оценка сходства Жаккара не меньше порога."""
+        candidates: Set[str] = set()
+        for key in self._band_keys(signature):
+            candidates.update(self.__buckets.get(key, []))
+        candidates.discard(exclude or "")
+        result = []
+        for candidate in candidates:
+            other = self.__signatures[candidate]
+            similarity = sum(1 for x, y in zip(signature, other) if x == y) / self.__num_perm
+            if similarity >= self.threshold:
+                result.append((candidate, similarity))
+        result.sort(key=lambda item: (-item[1], item[0]))
+        return result
+
+    def _add(self, vacancy: Dict) -> bool:
+        vacancy_id = vacancy.get("url")
+        if not vacancy_id:
+            return False
+        self._remove(vacancy_id)
+        signature = self.signature(vacancy)
+        if signature is None:
+            self._store(vacancy_id, vacancy_id, None)
+            return True
+        similar = self._similar(signature)
+        self._store(vacancy_id, self.__clusters[similar[0][0]] if similar else vacancy_id, signature)
+        return True
+
+    def _store(self, vacancy_id: str, cluster: str, signature: Optional[List[int]]) -> None:
+        """Сохраняет кластер и сигнатуру вакансии в памяти и раскладывает сигнатуру по корзинам LSH."""
+        self.__clusters[vacancy_id] = cluster
+        if signature is None:
+            return
+        self.__signatures[vacancy_id] = signature
+        for key in self._band_keys(signature):
+            self.__buckets.setdefault(key, []).append(vacancy_id)
+
+    def _remove(self, vacancy_id: str) -> bool:
+        if vacancy_id not in self.__clusters:
+            return False
+        del self.__clusters[vacancy_id]
+        signature = self.__signatures.pop(vacancy_id, None)
+        if signature is not None:
+            for key in self._band_keys(signature):
+                bucket = self.__buckets[key]
+                bucket.remove(vacancy_id)
+                if not bucket:
+                    del self.__buckets[key]
+        return True
+
+
+def deduplicate(vacancies: Iterable[Vacancy], threshold: float = 0.8) -> List[Vacancy]:
+    """Оставляет по одной вакансии из каждого кластера почти одинаковых вакансий - с самой высокой зарплатой.
+
+    Кластеры идут в порядке первого появления, при равной зарплате остается вакансия, встреченная раньше.
+    """
+    detector = NearDuplicateDetector(threshold=threshold)
+    best: Dict[str, Vacancy] = {}
+    for vacancy in vacancies:
+        detector.add(dict(vacancy))
+        cluster = detector.cluster_id(vacancy.url) or vacancy.url
+        if cluster not in best or vacancy > best[cluster]:
+            best[cluster] = vacancy
+    return list(best.values())
@@ -0,0 +1,161 @@
+import heapq
+import itertools
+import json
+import os
+import tempfile
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.file_manager import FileManager
+from src.salary_index import parse_salary, salary_midpoint
+
+SortKey = Callable[[Dict], Tuple]
+
+# Поля, которые сравниваются как числа; "salary" - нормализованная середина вилки
+NUMERIC_FIELDS = ("salary_from", "salary_to", "salary")
+
+
+class _Descending:
+    """Обертка, которая обращает порядок сравнения строк для сортировки по убыванию."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: str):
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return self.value > other.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+
+def make_sort_key(sort_by: Sequence[str]) -> SortKey:
+    """Создает функцию ключа сортировки по списку полей.
+
+    Префикс "-" означает сортировку по убыванию, например ("-salary_from", "title").
+    Зарплатные поля сравниваются как числа (неизвестная зарплата - 0), остальные - как строки.
+    """
+    if not sort_by:
+        raise ValueError("Не заданы поля сортировки")
+    fields = [(field.lstrip("-"), field.startswith("-")) for field in sort_by]
+
+    def sort_key(vacancy: Dict) -> Tuple:
+        key: List[Any] = []
+        for name, descending in fields:
+            if name in NUMERIC_FIELDS:
+                if name == "salary":
+                    midpoint = salary_midpoint(
+                        parse_salary(vacancy.get("salary_from")), parse_salary(vacancy.get("salary_to"))
+                    )
+                    number = midpoint or 0.0
+                else:
+                    number = parse_salary(vacancy.get(name))
+                key.append(-number if descending else number)
+            else:
+                text = str(vacancy.get(name) or "")
+                key.append(_Descending(text) if descending else text)
+        return tuple(key)
+
+    return sort_key
+
+
+def _write_run(records: Iterable[Dict], temp_dir: Optional[str]) -> str:
+    """Записывает отсортированную серию во временный файл JSON Lines."""
+    fd, path = tempfile.mkstemp(prefix="vacancies_run_", suffix=".jsonl", dir=temp_dir)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return path
+
+
+def _read_run(f: IO[str]) -> Iterator[Dict]:
+    """Читает серию из временного файла."""
+    for line in f:
+        yield json.loads(line)
+
+
+def _merge_runs(paths: List[str], key: SortKey) -> Iterator[Dict]:
+    """Выполняет k-путевое слияние серий."""
+    files = [open(path, "r", encoding="utf-8") for path in paths]
+    try:
+        yield from heapq.merge(*(_read_run(f) for f in files), key=key)
+    finally:
+        for f in files:
+            f.close()
+
+
+def external_sort(
+    vacancies: Iterable[Dict],
+    sort_by: Sequence[str] = ("-salary_from",),
+    memory_limit: int = 64 * 1024 * 1024,
+    max_open_runs: int = 64,
+    temp_dir: Optional[str] = None,
+) -> Iterator[Dict]:
+    """Сортирует поток вакансий с ограничением по памяти (внешняя сортировка слиянием).
+
+    Вакансии накапливаются в серии, пока их суммарный размер в JSON не превысит memory_limit байт;
+    отсортированные серии сбрасываются во временные файлы и затем сливаются. Если серий больше
+    max_open_runs, они сливаются в несколько проходов. Сортировка устойчивая.
+    """
+    if max_open_runs < 2:
+        raise ValueError("max_open_runs должно быть не меньше 2")
+    key = make_sort_key(sort_by)
+    runs: List[str] = []
+    temp_paths: List[str] = []
+    try:
+        run: List[Dict] = []
+        run_size = 0
+        for vacancy in vacancies:
+            run.append(vacancy)
+            run_size += len(json.dumps(vacancy, ensure_ascii=False).encode("utf-8"))
+            if run_size >= memory_limit:
+                run.sort(key=key)
+                runs.append(_write_run(run, temp_dir))
+                temp_paths.append(runs[-1])
+                run, run_size = [], 0
+        run.sort(key=key)
+        if not runs:
+            # Все данные поместились в память - временные файлы не нужны
+            yield from run
+            return
+        if run:
+            runs.append(_write_run(run, temp_dir))
+            temp_paths.append(runs[-1])
+        del run
+        while len(runs) > max_open_runs:
+            merged: List[str] = []
+            for start in range(0, len(runs), max_open_runs):
+                group = runs[start : start + max_open_runs]
+                merged.append(_write_run(_merge_runs(group, key), temp_dir))
+                temp_paths.append(merged[-1])
+                for old_path in group:
+                    os.remove(old_path)
+            runs = merged
+        yield from _merge_runs(runs, key)
+    finally:
+        for path in temp_paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def export_sorted(
+    source: FileManager,
+    destination: FileManager,
+    sort_by: Sequence[str] = ("-salary_from",),
+    memory_limit: int = 64 * 1024 * 1024,
+    temp_dir: Optional[str] = None,
+) -> int:
+    """Экспортирует все вакансии хранилища source в хранилище destination в отсортированном виде.
+
+    Источник дочитывается до конца (в память или во временные серии) до того, как destination
+    начинает запись, поэтому хранилище можно экспортировать само в себя.
+    Возвращает количество экспортированных вакансий.
+    """
+    sorted_vacancies = external_sort(
+        source.iter_vacancies(), sort_by=sort_by, memory_limit=memory_limit, temp_dir=temp_dir
+    )
+    # Сортировка выдает первую вакансию только после чтения всего источника: получаем ее до очистки destination
+    first = next(sorted_vacancies, None)
+    if first is None:
+        return destination.write_vacancies([])
+    return destination.write_vacancies(itertools.chain([first], sorted_vacancies))
@@ -0,0 +1,97 @@
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.api_client import HeadHunterAPI
+from src.hh_simulator import SimulatedHHServer
+from src.utils import get_vacancies_from_hh
+
+# Стратегии загрузки: имя -> количество параллельных потоков
+FETCH_STRATEGIES = {"sequential": 1, "threaded": 8}
+
+
+class _TimedHeadHunterAPI(HeadHunterAPI):
+    """HeadHunterAPI, который замеряет время получения каждой страницы (с учетом повторов)."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.__lock = threading.Lock()
+        self.latencies: List[float] = []
+        self.failed_pages = 0
+
+    def get_vacancies(self, search_query: str, area: str, page: int = 0) -> Optional[Dict[str, Any]]:
+        started = time.perf_counter()
+        data = super().get_vacancies(search_query, area, page)
+        elapsed = time.perf_counter() - started
+        with self.__lock:
+            self.latencies.append(elapsed)
+            if data is None:
+                self.failed_pages += 1
+        return data
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Перцентиль q (от 0 до 100) методом ближайшего ранга. Для пустого списка - 0."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def run_fetch_benchmark(
+    base_url: str,
+    search_query: str = "python",
+    area_id: str = "113",
+    num_pages: int = 20,
+    strategies: Optional[Dict[str, int]] = None,
+    max_retries: int = 3,
+    backoff: float = 0.05,
+    timeout: Optional[float] = 10.0,
+) -> Dict[str, Dict[str, float]]:
+    """Замеряет загрузку вакансий через get_vacancies_from_hh для каждой стратегии.
+
+    Для каждой стратегии возвращает количество страниц и вакансий, страниц в секунду,
+    p50/p99 времени получения страницы (в секундах), количество повторов и неудачных страниц.
+    """
+    report: Dict[str, Dict[str, float]] = {}
+    for name, workers in (strategies or FETCH_STRATEGIES).items():
+        api = _TimedHeadHunterAPI(base_url=base_url, max_retries=max_retries, backoff=backoff, timeout=timeout)
+        started = time.perf_counter()
+        vacancies = get_vacancies_from_hh(search_query, area_id, num_pages, api=api, workers=workers)
+        elapsed = time.perf_counter() - started
+        pages = len(api.latencies)
+        report[name] = {
+            "pages": pages,
+            "vacancies": len(vacancies),
+            "seconds": elapsed,
+            "pages_per_sec": pages / elapsed if elapsed else 0.0,
+            "p50_latency": percentile(api.latencies, 50),
+            "p99_latency": percentile(api.latencies, 99),
+            "retries": api.retry_count,
+            "failed_pages": api.failed_pages,
+        }
+    return report
+
+
+def format_report(report: Dict[str, Dict[str, float]]) -> str:
+    """Форматирует результаты замеров в виде таблицы."""
+    lines = [
+        f"{'Стратегия':<12} {'Страниц':>8} {'Вакансий':>9} {'Стр/с':>8} {'p50, мс':>9} "
+        f"{'p99, мс':>9} {'Повторов':>9} {'Ошибок':>7}"
+    ]
+    for name, stats in report.items():
+        lines.append(
+            f"{name:<12} {stats['pages']:>8.0f} {stats['vacancies']:>9.0f} {stats['pages_per_sec']:>8.1f} "
+            f"{stats['p50_latency'] * 1000:>9.1f} {stats['p99_latency'] * 1000:>9.1f} "
+            f"{stats['retries']:>9.0f} {stats['failed_pages']:>7.0f}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    with SimulatedHHServer(
+        latency=0.05, latency_distribution="lognormal", rate_limit_rate=0.05, error_rate=0.02
+    ) as server:
+        print(format_report(run_fetch_benchmark(server.base_url)))
@@ -1,12 +1,332 @@
 import abc
+import bz2
+import contextlib
 import csv
+import gzip
 import json
-from typing import Any, Dict, List
+import lzma
+import os
+import zlib
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.vacancy import Vacancy
+
+# Диапазон нормализованной зарплаты (нижняя и верхняя границы включительно, None - без ограничения)
+SalaryRange = Tuple[Optional[float], Optional[float]]
+
+# Модули сжатия по расширению файла и по сигнатуре (magic bytes) в начале файла
+COMPRESSION_SUFFIXES = {".gz": gzip, ".xz": lzma, ".lzma": lzma, ".bz2": bz2}
+COMPRESSION_MAGIC = ((b"\x1f\x8b", gzip), (b"\xfd7zXZ\x00", lzma), (b"BZh", bz2))
+
+# Ошибки чтения поврежденного сжатого файла. bz2 сообщает о поврежденных данных обычным OSError,
+# поэтому его ошибки распознаются функцией is_decompression_error
+DECOMPRESSION_ERRORS = (gzip.BadGzipFile, EOFError, lzma.LZMAError, zlib.error)
+
+
+def is_decompression_error(error: BaseException) -> bool:
+    """Проверяет, что ошибка вызвана поврежденными сжатыми данными, а не вводом-выводом (EIO, нет прав и т.п.)."""
+    if isinstance(error, DECOMPRESSION_ERRORS):
+        return True
+    # Ошибка данных bz2 - OSError без errno, у системных ошибок ввода-вывода errno задан
+    return type(error) is OSError and error.errno is None
+
+
+def open_file(filename: str, mode: str = "r", newline: Optional[str] = None) -> IO[str]:
+    """Открывает текстовый файл с прозрачным сжатием gzip/lzma/bz2.
+
+    При чтении формат определяется по сигнатуре файла (если она не распознана - по расширению),
+    при записи - по расширению (.gz, .xz, .lzma, .bz2).
+    Распаковка выполняется потоково по мере чтения.
+    """
+    compression = COMPRESSION_SUFFIXES.get(os.path.splitext(filename)[1].lower())
+    if "r" in mode and os.path.exists(filename):
+        with open(filename, "rb") as f:
+            header = f.read(6)
+        compression = next((module for magic, module in COMPRESSION_MAGIC if header.startswith(magic)), compression)
+    if compression is None:
+        return open(filename, mode, newline=newline, encoding="utf-8")
+    text_mode = mode if "t" in mode else mode + "t"
+    stream: IO[str] = compression.open(filename, text_mode, newline=newline, encoding="utf-8")  # type: ignore
+    return stream
+
+
+@contextlib.contextmanager
+def replace_file(filename: str, newline: Optional[str] = None) -> Iterator[IO[str]]:
+    """Открывает на запись временный файл рядом с filename и заменяет им filename только при успешной записи.
+
+    Временный файл сохраняет расширение сжатия, поэтому записывается в том же формате.
+    При ошибке записи временный файл удаляется, а прежнее содержимое filename не меняется.
+    """
+    root, suffix = os.path.splitext(filename)
+    temp_filename = f"{root}.tmp{suffix}" if suffix.lower() in COMPRESSION_SUFFIXES else filename + ".tmp"
+    try:
+        with open_file(temp_filename, "w", newline=newline) as f:
+            yield f
+    except BaseException:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        raise
+    os.replace(temp_filename, filename)
+
+
+def iter_json_array(f: IO[str], chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Потоково разбирает JSON-массив, читая файл блоками по chunk_size символов."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    opened = eof = False
+    while True:
+        while position < len(buffer) and (buffer[position].isspace() or (opened and buffer[position] == ",")):
+            position += 1
+        if position >= len(buffer) and not eof:
+            buffer = buffer[position:] + f.read(chunk_size)
+            position = 0
+            eof = position >= len(buffer)
+            continue
+        if position >= len(buffer):
+            raise json.JSONDecodeError("Неожиданный конец JSON-массива", buffer, position)
+        if not opened:
+            if buffer[position] != "[":
+                raise json.JSONDecodeError("Ожидался JSON-массив", buffer, position)
+            opened = True
+            position += 1
+            continue
+        if buffer[position] == "]":
+            return
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            item, end = None, len(buffer)
+        if end >= len(buffer) and not eof:
+            # Элемент мог быть обрезан границей блока: дочитываем и разбираем заново
+            chunk = f.read(chunk_size)
+            buffer = buffer[position:] + chunk
+            position = 0
+            eof = not chunk
+            continue
+        yield item
+        position = end
+        if position > chunk_size:
+            buffer = buffer[position:]
+            position = 0
+
+
+def iter_json_lines(filename: str) -> Iterator[Any]:
+    """Перебирает записи файла JSON Lines. Поврежденные строки (например, недописанная последняя) пропускаются."""
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def append_json_lines(filename: str, records: Iterable[Any]) -> int:
+    """Дописывает записи в конец файла JSON Lines. Возвращает количество записей."""
+    count = 0
+    with open(filename, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+class OperationLog:
+    """Журнал операций в формате JSON Lines со сжатием.
+
+    Изменения дописываются в конец файла. Когда записей в журнале становится больше
+    COMPACT_RATIO * live + COMPACT_MIN (live - количество актуальных записей), журнал заменяется
+    снимком текущего состояния, поэтому запись изменения в среднем занимает O(1).
+    """
+
+    COMPACT_RATIO = 2
+    COMPACT_MIN = 1000
+
+    def __init__(self, filename: str, snapshot: Callable[[], Iterable[Any]]):
+        """Инициализация журнала. snapshot возвращает записи, полностью описывающие текущее состояние."""
+        self.__filename = filename
+        self.__snapshot = snapshot
+        self.__size = 0
+
+    @property
+    def filename(self) -> str:
+        return self.__filename
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def replay(self) -> Iterator[Any]:
+        """Перебирает записи журнала по порядку. Поврежденные строки пропускаются."""
+        self.__size = 0
+        if not os.path.exists(self.__filename):
+            return
+        for record in iter_json_lines(self.__filename):
+            self.__size += 1
+            yield record
+
+    def append(self, records: Iterable[Any], live: int) -> None:
+        """Дописывает записи в журнал. Новый или слишком разросшийся журнал заменяется снимком состояния."""
+        if not os.path.exists(self.__filename):
+            self.compact()
+            return
+        self.__size += append_json_lines(self.__filename, records)
+        if self.__size > self.COMPACT_RATIO * live + self.COMPACT_MIN:
+            self.compact()
+
+    def compact(self) -> None:
+        """Заменяет журнал снимком текущего состояния (через временный файл)."""
+        temp_filename = self.__filename + ".tmp"
+        count = 0
+        with open(temp_filename, "w", encoding="utf-8") as f:
+            for record in self.__snapshot():
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+        os.replace(temp_filename, self.__filename)
+        self.__size = count
+
+
+class VacancyIndex(abc.ABC):
+    """Абстрактный класс для вспомогательных структур, которые хранилище обновляет при изменении данных."""
+
+    @abc.abstractmethod
+    def add(self, vacancy: Dict) -> None:
+        """Учитывает добавленную в хранилище вакансию."""
+        pass
+
+    @abc.abstractmethod
+    def remove(self, vacancy_id: str) -> None:
+        """Учитывает удаление вакансии из хранилища."""
+        pass
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Учитывает полную очистку хранилища."""
+        pass
+
+    def candidate_ids(self, salary_range: SalaryRange) -> Optional[Set[str]]:
+        """Id вакансий, которые могут попасть в диапазон зарплат. None - индекс не умеет отвечать на запрос."""
+        return None
+
+    def attach(self, file_manager: "FileManager") -> None:
+        """Сверяет индекс с хранилищем перед первым запросом к нему.
+
+        Индексы, которые отвечают на candidate_ids, должны перестроиться, если не соответствуют хранилищу
+        (например, индекс создан пустым для уже заполненного файла).
+        """
+        pass
 
 
 class FileManager(abc.ABC):
     """Абстрактный класс для работы с файлами, содержащими информацию о вакансиях."""
 
+    def __init__(self, indexes: Optional[List[VacancyIndex]] = None):
+        """Инициализация объекта FileManager со списком поддерживаемых индексов."""
+        self._indexes: List[VacancyIndex] = list(indexes) if indexes else []
+        self._indexes_attached = False
+
+    @property
+    def indexes(self) -> List[VacancyIndex]:
+        return self._indexes
+
+    def get_candidates(
+        self, salary_range: Optional[SalaryRange] = None, areas: Optional[Set[str]] = None
+    ) -> List[Dict]:
+        """Получает вакансии, которые могут удовлетворять ограничениям, сужая выборку с помощью индексов."""
+        return self._narrow_candidates(self.get_vacancies(), salary_range, areas)
+
+    def count_vacancies(self) -> int:
+        """Количество вакансий в хранилище."""
+        return sum(1 for _ in self.iter_vacancies())
+
+    def iter_vacancies(self) -> Iterator[Dict]:
+        """Перебирает вакансии хранилища. Наследники могут читать данные потоково, не загружая их целиком."""
+        return iter(self.get_vacancies())
+
+    def write_vacancies(self, vacancies: Iterable[Dict]) -> int:
+        """Заменяет содержимое хранилища переданными вакансиями. Возвращает количество записанных вакансий."""
+        self.clear_file()
+        count = 0
+        for vacancy in vacancies:
+            self.add_vacancy(vacancy)
+            count += 1
+        return count
+
+    def _narrow_candidates(
+        self, vacancies: List[Dict], salary_range: Optional[SalaryRange], areas: Optional[Set[str]]
+    ) -> List[Dict]:
+        """Оставляет вакансии из регионов areas, которые индексы считают подходящими под диапазон зарплат."""
+        if areas is not None:
+            vacancies = [v for v in vacancies if str(v.get("area") or "") in areas]
+        if salary_range is None:
+            return vacancies
+        self._attach_indexes()
+        ids: Optional[Set[str]] = None
+        for index in self._indexes:
+            candidates = index.candidate_ids(salary_range)
+            if candidates is not None:
+                ids = candidates if ids is None else ids & candidates
+        if ids is None:
+            return vacancies
+        return [v for v in vacancies if v.get("url") in ids]
+
+    def _attach_indexes(self) -> None:
+        """Один раз сверяет индексы с содержимым хранилища."""
+        if self._indexes_attached:
+            return
+        self._indexes_attached = True
+        for index in self._indexes:
+            index.attach(self)
+
+    def _merge_vacancy(self, vacancy: Dict, vacancies: List[Dict]) -> bool:
+        """Добавляет вакансию в vacancies или заменяет сохраненную вакансию с тем же url, если она изменилась.
+
+        Вакансии с url сравниваются по url (id вакансии), без url - целиком.
+        Возвращает False, если такая вакансия уже сохранена без изменений (список не меняется).
+        """
+        vacancy_id = vacancy.get("url")
+        if not vacancy_id:
+            if vacancy in vacancies:
+                return False
+            vacancies.append(vacancy)
+            return True
+        for i, stored in enumerate(vacancies):
+            if stored.get("url") == vacancy_id:
+                if self._same_content(stored, vacancy):
+                    return False
+                vacancies[i] = vacancy
+                return True
+        vacancies.append(vacancy)
+        return True
+
+    @staticmethod
+    def _same_content(stored: Dict, vacancy: Dict) -> bool:
+        """Проверяет, совпадает ли сохраненная вакансия с новой."""
+        return stored == vacancy
+
+    def _notify_add(self, vacancy: Dict) -> None:
+        """Обновляет индексы после добавления вакансии."""
+        for index in self._indexes:
+            index.add(vacancy)
+
+    def _notify_delete(self, vacancy_id: str) -> None:
+        """Обновляет индексы после удаления вакансии."""
+        for index in self._indexes:
+            index.remove(vacancy_id)
+
+    def _notify_clear(self) -> None:
+        """Обновляет индексы после очистки хранилища."""
+        for index in self._indexes:
+            index.clear()
+
+    def _restore_indexes(self) -> None:
+        """Перестраивает индексы по содержимому хранилища после неудачной записи."""
+        self._notify_clear()
+        for vacancy in self.iter_vacancies():
+            self._notify_add(vacancy)
+
     @abc.abstractmethod
     def get_vacancies(self) -> List[Dict]:
         """Получает данные из файла."""
@@ -29,10 +349,11 @@ class FileManager(abc.ABC):
 
 
 class JSONFileManager(FileManager):
-    """Класс для сохранения информации о вакансиях в JSON-файл."""
+    """Класс для сохранения информации о вакансиях в JSON-файл (в том числе сжатый gzip/lzma/bz2)."""
 
-    def __init__(self, filename: str = "vacancies.json"):
+    def __init__(self, filename: str = "vacancies.json", indexes: Optional[List[VacancyIndex]] = None):
         """Инициализация объекта JSONFileManager."""
+        super().__init__(indexes)
         self.__filename = filename
 
     @property
@@ -40,35 +361,93 @@ class JSONFileManager(FileManager):
         return self.__filename
 
     def get_vacancies(self) -> List[Dict[str, Any]]:
-        """Получает данные из JSON-файла."""
+        """Получает данные из JSON-файла. Поврежденный файл читается как пустой."""
         try:
-            with open(self.__filename, "r", encoding="utf-8") as f:
-                data: List[Dict[str, Any]] = json.load(f)
-        except FileNotFoundError:
+            return self._read_vacancies()
+        except ValueError:
             return []
-        except json.JSONDecodeError:  # Обработка случая поврежденного JSON
+
+    def _read_vacancies(self) -> List[Dict[str, Any]]:
+        """Читает все вакансии JSON-файла. Поврежденный файл вызывает ValueError, чтобы его не перезаписали."""
+        try:
+            with open_file(self.__filename, "r") as f:
+                data: List[Dict[str, Any]] = list(iter_json_array(f))
+        except FileNotFoundError:
             return []
+        except json.JSONDecodeError as e:  # Обработка случая поврежденного JSON
+            raise ValueError(f"JSON-файл {self.__filename} поврежден: {e}") from e
+        except (*DECOMPRESSION_ERRORS, OSError) as e:  # Обработка случая поврежденного сжатого файла
+            if not is_decompression_error(e):  # Ошибки ввода-вывода не выдаются за пустой файл
+                raise
+            raise ValueError(f"JSON-файл {self.__filename} поврежден: {e}") from e
         return data
 
+    def iter_vacancies(self) -> Iterator[Dict[str, Any]]:
+        """Потоково перебирает вакансии JSON-файла.
+
+        Поврежденный файл вызывает ValueError, а не обрывает перебор молча, чтобы прочитанная часть
+        не была принята за все содержимое (например, при экспорте).
+        """
+        try:
+            with open_file(self.__filename, "r") as f:
+                yield from iter_json_array(f)
+        except FileNotFoundError:
+            return
+        except json.JSONDecodeError as e:  # Обработка случая поврежденного JSON
+            raise ValueError(f"JSON-файл {self.__filename} поврежден: {e}") from e
+        except (*DECOMPRESSION_ERRORS, OSError) as e:
+            if not is_decompression_error(e):
+                raise
+            raise ValueError(f"JSON-файл {self.__filename} поврежден: {e}") from e
+
+    def write_vacancies(self, vacancies: Iterable[Dict]) -> int:
+        """Потоково записывает вакансии в JSON-файл, заменяя его содержимое (без проверки на дублирование).
+
+        Запись идет во временный файл, который заменяет JSON-файл только после успешной записи всех вакансий.
+        """
+        self._notify_clear()
+        count = 0
+        try:
+            with replace_file(self.__filename) as f:
+                f.write("[")
+                for vacancy in vacancies:
+                    f.write(",\n" if count else "\n")
+                    f.write(json.dumps(vacancy, indent=4, ensure_ascii=False))
+                    self._notify_add(vacancy)
+                    count += 1
+                f.write("\n]" if count else "]")
+        except Exception:
+            self._restore_indexes()
+            raise
+        return count
+
     def add_vacancy(self, vacancy: Dict) -> None:
-        """Добавляет вакансию в JSON-файл, не допуская дублирования."""
-        existing_vacancies = self.get_vacancies()
-        if vacancy not in existing_vacancies:  # Проверка на дублирование
-            existing_vacancies.append(vacancy)
-            with open(self.__filename, "w", encoding="utf-8") as f:  # Указываем encoding='utf-8'
+        """Добавляет вакансию в JSON-файл, не допуская дублирования. Изменившаяся вакансия заменяется.
+
+        Поврежденный файл не перезаписывается: вызывается ValueError.
+        """
+        existing_vacancies = self._read_vacancies()
+        if self._merge_vacancy(vacancy, existing_vacancies):  # Проверка на дублирование
+            with open_file(self.__filename, "w") as f:
                 json.dump(existing_vacancies, f, indent=4, ensure_ascii=False)
+            self._notify_add(vacancy)
 
     def delete_vacancy(self, vacancy_id: str) -> None:
-        """Удаляет информацию о вакансии из JSON-файла."""
-        vacancies = self.get_vacancies()
+        """Удаляет информацию о вакансии из JSON-файла.
+
+        Поврежденный файл не перезаписывается: вызывается ValueError.
+        """
+        vacancies = self._read_vacancies()
         updated_vacancies = [v for v in vacancies if v.get("url") != vacancy_id]
-        with open(self.__filename, "w", encoding="utf-8") as f:
+        with open_file(self.__filename, "w") as f:
             json.dump(updated_vacancies, f, indent=4, ensure_ascii=False)
+        self._notify_delete(vacancy_id)
 
     def clear_file(self) -> None:
         """Полностью очищает JSON-файл с данными."""
-        with open(self.__filename, "w") as f:
+        with open_file(self.__filename, "w") as f:
             json.dump([], f)
+        self._notify_clear()
 
     # Методы для БД (заглушки)
     def get_by_id(self, vacancy_id: str) -> None:
@@ -79,10 +458,11 @@ class JSONFileManager(FileManager):
 
 
 class CSVFileManager(FileManager):
-    """Класс для сохранения информации о вакансиях в CSV-файл."""
+    """Класс для сохранения информации о вакансиях в CSV-файл (в том числе сжатый gzip/lzma/bz2)."""
 
-    def __init__(self, filename: str = "vacancies.csv"):
+    def __init__(self, filename: str = "vacancies.csv", indexes: Optional[List[VacancyIndex]] = None):
         """Инициализация объекта CSVFileManager."""
+        super().__init__(indexes)
         self.__filename = filename
 
     @property
@@ -90,48 +470,117 @@ class CSVFileManager(FileManager):
         return self.__filename
 
     def get_vacancies(self) -> List[Dict]:
-        """Получает данные из CSV-файла."""
+        """Получает данные из CSV-файла. Поврежденный файл читается как пустой."""
         try:
-            with open(self.__filename, "r", newline="", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
-                return list(reader)
-        except FileNotFoundError:
-            return []
-        except Exception as e:
+            return self._read_vacancies()
+        except ValueError as e:
             print(f"Ошибка чтения из CSV-файла: {e}")
             return []
 
+    def _read_vacancies(self) -> List[Dict]:
+        """Читает все вакансии CSV-файла. Поврежденный файл вызывает ValueError, чтобы его не перезаписали."""
+        try:
+            with open_file(self.__filename, "r", newline="") as csvfile:
+                return list(csv.DictReader(csvfile))
+        except FileNotFoundError:
+            return []
+        except csv.Error as e:
+            raise ValueError(f"CSV-файл {self.__filename} поврежден: {e}") from e
+        except (*DECOMPRESSION_ERRORS, OSError) as e:  # Обработка случая поврежденного сжатого файла
+            if not is_decompression_error(e):  # Ошибки ввода-вывода не выдаются за пустой файл
+                raise
+            raise ValueError(f"CSV-файл {self.__filename} поврежден: {e}") from e
+
+    def iter_vacancies(self) -> Iterator[Dict]:
+        """Потоково перебирает вакансии CSV-файла. Поврежденный файл вызывает ValueError."""
+        try:
+            with open_file(self.__filename, "r", newline="") as csvfile:
+                yield from csv.DictReader(csvfile)
+        except FileNotFoundError:
+            return
+        except csv.Error as e:
+            raise ValueError(f"CSV-файл {self.__filename} поврежден: {e}") from e
+        except (*DECOMPRESSION_ERRORS, OSError) as e:
+            if not is_decompression_error(e):
+                raise
+            raise ValueError(f"CSV-файл {self.__filename} поврежден: {e}") from e
+
+    def write_vacancies(self, vacancies: Iterable[Dict]) -> int:
+        """Потоково записывает вакансии в CSV-файл, заменяя его содержимое.
+
+        Заголовки - поля первой вакансии и все поля Vacancy, отсутствующие у вакансии поля остаются пустыми.
+        Вакансия с полем, которого нет в заголовках, вызывает ValueError (данные не теряются молча).
+        Запись идет во временный файл, поэтому при ошибке прежнее содержимое CSV-файла сохраняется.
+        """
+        self._notify_clear()
+        count = 0
+        try:
+            with replace_file(self.__filename, newline="") as csvfile:
+                writer: Optional[csv.DictWriter] = None
+                for vacancy in vacancies:
+                    if writer is None:
+                        fieldnames = list(dict.fromkeys([*vacancy.keys(), *Vacancy.__slots__]))
+                        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                        writer.writeheader()  # Запись заголовков
+                    writer.writerow(vacancy)
+                    self._notify_add(vacancy)
+                    count += 1
+        except Exception:
+            self._restore_indexes()
+            raise
+        return count
+
     def add_vacancy(self, vacancy: Dict) -> None:
-        """Добавляет вакансию в CSV-файл."""
-        vacancies = self.get_vacancies()
-        if vacancy not in vacancies:  # Проверка на дублирование
-            vacancies.append(vacancy)
+        """Добавляет вакансию в CSV-файл. Изменившаяся вакансия заменяется.
+
+        Поврежденный файл не перезаписывается: вызывается ValueError.
+        """
+        vacancies = self._read_vacancies()
+        if self._merge_vacancy(vacancy, vacancies):  # Проверка на дублирование
             fieldnames = vacancy.keys()
             try:
-                with open(self.__filename, "w", newline="", encoding="utf-8") as csvfile:
+                with open_file(self.__filename, "w", newline="") as csvfile:
                     writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                     writer.writeheader()  # Запись заголовков
                     writer.writerows(vacancies)
             except Exception as e:
                 print(f"Ошибка записи CSV-файла: {e}")
+                return
+            self._notify_add(vacancy)
 
     def delete_vacancy(self, vacancy_id: str) -> None:
-        """Удаляет информацию о вакансии из CSV-файла."""
-        vacancies = self.get_vacancies()
+        """Удаляет информацию о вакансии из CSV-файла.
+
+        Поврежденный файл не перезаписывается: вызывается ValueError.
+        """
+        vacancies = self._read_vacancies()
         updated_vacancies = [v for v in vacancies if v.get("url") != vacancy_id]
         fieldnames = vacancies[0].keys() if vacancies else []
         try:
-            with open(self.__filename, "w", newline="", encoding="utf-8") as csvfile:
+            with open_file(self.__filename, "w", newline="") as csvfile:
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()  # Запись заголовков
                 writer.writerows(updated_vacancies)
         except Exception as e:
             print(f"Ошибка записи из CSV-файла: {e}")
+            return
+        self._notify_delete(vacancy_id)
+
+    @staticmethod
+    def _same_content(stored: Dict, vacancy: Dict) -> bool:
+        """Сравнивает вакансии как строки CSV: числа читаются из файла строками, None - пустой строкой."""
+        return all(
+            str(stored.get(key) if stored.get(key) is not None else "")
+            == str(vacancy.get(key) if vacancy.get(key) is not None else "")
+            for key in {*stored, *vacancy}
+        )
 
     def clear_file(self) -> None:
         """Полностью очищает CSV-файл с данными."""
         try:
-            with open(self.__filename, "w", newline="", encoding="utf-8") as csvfile:
-                csvfile.truncate(0)  # Сократите файл до 0 байт
+            with open_file(self.__filename, "w", newline="") as csvfile:
+                csvfile.write("")  # Открытие в режиме "w" уже очищает файл (в том числе сжатый)
         except Exception as e:
             print(f"Ошибка при очистке CSV-файла: {e}")
+            return
+        self._notify_clear()
@@ -0,0 +1,195 @@
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+# Поддерживаемые распределения задержки ответа
+LATENCY_DISTRIBUTIONS = ("constant", "uniform", "exponential", "lognormal")
+
+
+class SimulatedHHServer:
+    """Локальный HTTP-сервер, имитирующий эндпоинт /vacancies API hh.ru.
+
+    Позволяет настроить задержку ответа (распределение и среднее значение в секундах), долю ответов
+    429 и 500, количество найденных вакансий, ограничение глубины выдачи (как у hh.ru - 2000 вакансий)
+    и медленную передачу тела ответа. Используется для нагрузочных замеров клиента без обращения к hh.ru.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        found: int = 2000,
+        max_depth: int = 2000,
+        latency: float = 0.0,
+        latency_distribution: str = "constant",
+        rate_limit_rate: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: Optional[float] = None,
+        slow_body_delay: float = 0.0,
+        seed: int = 0,
+    ):
+        """Инициализация сервера. port=0 - выбрать свободный порт."""
+        if latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Неизвестное распределение задержки: {latency_distribution}")
+        self.found = found
+        self.max_depth = max_depth
+        self.latency = latency
+        self.latency_distribution = latency_distribution
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.slow_body_delay = slow_body_delay
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.stats: Dict[str, int] = {"requests": 0, "ok": 0, "rate_limited": 0, "errors": 0, "bad_request": 0}
+        self.__server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.__server.daemon_threads = True
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.__server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> "SimulatedHHServer":
+        """Запускает сервер в фоновом потоке."""
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Останавливает сервер."""
+        self.__server.shutdown()
+        self.__server.server_close()
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def __enter__(self) -> "SimulatedHHServer":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def _sample_latency(self) -> float:
+        """Случайная задержка ответа согласно выбранному распределению."""
+        with self.__lock:
+            if self.latency <= 0 or self.latency_distribution == "constant":
+                return max(self.latency, 0.0)
+            if self.latency_distribution == "uniform":
+                return self.__random.uniform(0, 2 * self.latency)
+            if self.latency_distribution == "exponential":
+                return self.__random.expovariate(1 / self.latency)
+            # Логнормальное распределение с тяжелым хвостом и средним self.latency
+            sigma = 1.0
+            return self.__random.lognormvariate(math.log(self.latency) - sigma**2 / 2, sigma)
+
+    def _choose_outcome(self) -> str:
+        """Определяет, чем ответит сервер: ok, rate_limited или errors."""
+        with self.__lock:
+            roll = self.__random.random()
+        if roll < self.rate_limit_rate:
+            return "rate_limited"
+        if roll < self.rate_limit_rate + self.error_rate:
+            return "errors"
+        return "ok"
+
+    def _count(self, key: str) -> None:
+        with self.__lock:
+            self.stats[key] += 1
+
+    def _vacancies_page(self, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Формирует страницу выдачи в формате API hh.ru."""
+        page = int(query.get("page", ["0"])[0])
+        per_page = int(query.get("per_page", ["20"])[0])
+        area = query.get("area", ["113"])[0]
+        text = query.get("text", [""])[0]
+        available = min(self.found, self.max_depth)
+        start = page * per_page
+        items = []
+        for number in range(start, min(start + per_page, available)):
+            salary_from = 50000 + (number * 7919) % 250000
+            items.append(
+                {
+                    "id": str(number),
+                    "name": f"{text or 'Разработчик'} #{number}",
+                    "alternate_url": f"https://hh.ru/vacancy/{number}",
+                    "area": {"id": area},
+                    "salary": {"from": salary_from, "to": salary_from + 50000, "currency": "RUR"},
+                    "snippet": {
+                        "requirement": f"Опыт работы с <highlighttext>{text}</highlighttext> от {number % 6} лет.",
+                        "responsibility": "Разработка и поддержка сервисов.",
+                    },
+                }
+            )
+        return {
+            "items": items,
+            "found": self.found,
+            "pages": math.ceil(available / per_page) if per_page else 0,
+            "page": page,
+            "per_page": per_page,
+        }
+
+    def _make_handler(self) -> type:
+        simulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _send(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if simulator.slow_body_delay > 0:
+                    # Медленное тело ответа: отправляем по частям с паузами
+                    for start in range(0, len(body), 4096):
+                        self.wfile.write(body[start : start + 4096])
+                        self.wfile.flush()
+                        time.sleep(simulator.slow_body_delay)
+                else:
+                    self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                simulator._count("requests")
+                time.sleep(simulator._sample_latency())
+                parsed = urlparse(self.path)
+                if parsed.path.rstrip("/") == "":
+                    self._send(200, {})
+                    return
+                if parsed.path.rstrip("/") != "/vacancies":
+                    self._send(404, {"errors": [{"type": "not_found"}]})
+                    return
+                outcome = simulator._choose_outcome()
+                if outcome == "rate_limited":
+                    simulator._count("rate_limited")
+                    headers = {} if simulator.retry_after is None else {"Retry-After": str(simulator.retry_after)}
+                    self._send(429, {"errors": [{"type": "too_many_requests"}]}, headers)
+                    return
+                if outcome == "errors":
+                    simulator._count("errors")
+                    self._send(500, {"errors": [{"type": "server_error"}]})
+                    return
+                query = parse_qs(parsed.query)
+                try:
+                    page = int(query.get("page", ["0"])[0])
+                    per_page = int(query.get("per_page", ["20"])[0])
+                except ValueError:
+                    page, per_page = -1, 0
+                if page < 0 or per_page <= 0 or page * per_page >= simulator.max_depth:
+                    # hh.ru не отдает вакансии глубже max_depth и отвечает 400; последняя страница может быть неполной
+                    simulator._count("bad_request")
+                    self._send(400, {"errors": [{"type": "bad_argument", "value": "page"}]})
+                    return
+                simulator._count("ok")
+                self._send(200, simulator._vacancies_page(query))
+
+        return Handler
@@ -0,0 +1,189 @@
+import bisect
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.file_manager import VacancyIndex
+from src.salary_index import parse_salary
+
+
+class VacancyHistory(VacancyIndex):
+    """Хранилище истории изменений вакансий.
+
+    Для каждой вакансии (id - её url) в файл JSON Lines дописываются только изменившиеся поля
+    и список исчезнувших полей.
+    Каждые checkpoint_every изменений записывается полное состояние (контрольная точка),
+    поэтому восстановление состояния на дату требует применить не больше checkpoint_every дельт.
+    """
+
+    CHECKPOINT = "checkpoint"
+    DELTA = "delta"
+    REMOVED = "removed"
+
+    def __init__(self, filename: str = "vacancies_history.jsonl", checkpoint_every: int = 10):
+        """Инициализация объекта VacancyHistory. Существующая история загружается из файла."""
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every должен быть положительным")
+        self.__filename = filename
+        self.__checkpoint_every = checkpoint_every
+        self.__entries: Dict[str, List[Dict[str, Any]]] = {}
+        self.__timestamps: Dict[str, List[datetime]] = {}
+        self.__checkpoints: Dict[str, List[int]] = {}
+        self.__current: Dict[str, Optional[Dict[str, Any]]] = {}
+        if os.path.exists(filename):
+            self._load()
+
+    @property
+    def filename(self) -> str:
+        return self.__filename
+
+    @property
+    def vacancy_ids(self) -> List[str]:
+        return list(self.__entries)
+
+    def record(self, vacancies: Iterable[Dict], timestamp: Optional[datetime] = None) -> int:
+        """Записывает состояние вакансий после очередного сбора. Возвращает количество записей в истории."""
+        moment = timestamp or datetime.now()
+        batch = [(vacancy["url"], dict(vacancy)) for vacancy in vacancies if vacancy.get("url")]
+        # Весь пакет проверяется до изменения состояния в памяти, чтобы ошибка не оставила его рассинхронизированным
+        for vacancy_id, _ in batch:
+            self._check_order(vacancy_id, moment)
+        new_entries = []
+        for vacancy_id, vacancy in batch:
+            entry = self._make_entry(vacancy_id, vacancy, moment)
+            if entry is not None:
+                new_entries.append(entry)
+        self._append(new_entries)
+        return len(new_entries)
+
+    def record_removal(self, vacancy_id: str, timestamp: Optional[datetime] = None) -> None:
+        """Отмечает, что вакансия удалена (например, снята с публикации)."""
+        if self.__current.get(vacancy_id) is None:
+            return
+        moment = timestamp or datetime.now()
+        self._check_order(vacancy_id, moment)
+        entry = {"id": vacancy_id, "ts": moment, "type": self.REMOVED, "data": {}}
+        self._apply(entry)
+        self._append([entry])
+
+    def state_as_of(self, vacancy_id: str, moment: datetime) -> Optional[Dict[str, Any]]:
+        """Восстанавливает состояние вакансии на момент moment. None - вакансии еще (или уже) нет."""
+        timestamps = self.__timestamps.get(vacancy_id)
+        if not timestamps:
+            return None
+        last = bisect.bisect_right(timestamps, moment) - 1
+        if last < 0:
+            return None
+        checkpoints = self.__checkpoints[vacancy_id]
+        start = checkpoints[bisect.bisect_right(checkpoints, last) - 1]
+        entries = self.__entries[vacancy_id]
+        state: Optional[Dict[str, Any]] = None
+        for entry in entries[start : last + 1]:
+            state = self._merge(state, entry)
+        return state
+
+    def snapshot_as_of(self, moment: datetime) -> Dict[str, Dict[str, Any]]:
+        """Восстанавливает состояние всех вакансий на момент moment."""
+        snapshot = {}
+        for vacancy_id in self.__entries:
+            state = self.state_as_of(vacancy_id, moment)
+            if state is not None:
+                snapshot[vacancy_id] = state
+        return snapshot
+
+    def salary_timeline(self, vacancy_id: str) -> List[Tuple[datetime, int, int]]:
+        """Возвращает историю зарплатной вилки вакансии: (момент, зарплата от, зарплата до)."""
+        timeline: List[Tuple[datetime, int, int]] = []
+        state: Optional[Dict[str, Any]] = None
+        for entry in self.__entries.get(vacancy_id, []):
+            state = self._merge(state, entry)
+            if state is None:
+                continue
+            point = (entry["ts"], parse_salary(state.get("salary_from")), parse_salary(state.get("salary_to")))
+            if not timeline or timeline[-1][1:] != point[1:]:
+                timeline.append(point)
+        return timeline
+
+    def add(self, vacancy: Dict) -> None:
+        """Записывает добавленную в хранилище вакансию."""
+        self.record([vacancy])
+
+    def remove(self, vacancy_id: str) -> None:
+        """Отмечает удаление вакансии из хранилища."""
+        self.record_removal(vacancy_id)
+
+    def clear(self) -> None:
+        """История сохраняется при очистке хранилища."""
+        pass
+
+    def _check_order(self, vacancy_id: str, moment: datetime) -> None:
+        """Проверяет, что запись не раньше последней записи по вакансии."""
+        timestamps = self.__timestamps.get(vacancy_id)
+        if timestamps and moment < timestamps[-1]:
+            raise ValueError(f"Момент {moment} раньше последней записи по вакансии {vacancy_id}")
+
+    def _make_entry(self, vacancy_id: str, vacancy: Dict[str, Any], moment: datetime) -> Optional[Dict[str, Any]]:
+        """Создает и применяет запись истории для нового состояния вакансии (None - ничего не изменилось)."""
+        previous = self.__current.get(vacancy_id)
+        removed: List[str] = []
+        if previous is None:
+            entry_type, data = self.CHECKPOINT, vacancy
+        else:
+            data = {key: value for key, value in vacancy.items() if key not in previous or previous[key] != value}
+            removed = [key for key in previous if key not in vacancy]
+            if not data and not removed:
+                return None
+            since_checkpoint = len(self.__entries[vacancy_id]) - self.__checkpoints[vacancy_id][-1]
+            if since_checkpoint >= self.__checkpoint_every:
+                entry_type, data, removed = self.CHECKPOINT, vacancy, []
+            else:
+                entry_type = self.DELTA
+        entry = {"id": vacancy_id, "ts": moment, "type": entry_type, "data": data}
+        if removed:
+            entry["removed"] = removed
+        self._apply(entry)
+        return entry
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        """Добавляет запись в индексы в памяти."""
+        vacancy_id = entry["id"]
+        entries = self.__entries.setdefault(vacancy_id, [])
+        if entry["type"] == self.CHECKPOINT:
+            self.__checkpoints.setdefault(vacancy_id, []).append(len(entries))
+        entries.append(entry)
+        self.__timestamps.setdefault(vacancy_id, []).append(entry["ts"])
+        self.__current[vacancy_id] = self._merge(self.__current.get(vacancy_id), entry)
+
+    def _merge(self, state: Optional[Dict[str, Any]], entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Применяет запись истории к состоянию вакансии."""
+        if entry["type"] == self.REMOVED:
+            return None
+        if entry["type"] == self.CHECKPOINT or state is None:
+            return dict(entry["data"])
+        merged = {**state, **entry["data"]}
+        for key in entry.get("removed", []):
+            merged.pop(key, None)
+        return merged
+
+    def _append(self, entries: List[Dict[str, Any]]) -> None:
+        """Дописывает записи в конец файла истории."""
+        if not entries:
+            return
+        with open(self.__filename, "a", encoding="utf-8") as f:
+            for entry in entries:
+                line = {**entry, "ts": entry["ts"].isoformat()}
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+    def _load(self) -> None:
+        """Загружает историю из файла. Поврежденные строки пропускаются."""
+        with open(self.__filename, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    entry["ts"] = datetime.fromisoformat(entry["ts"])
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    continue
+                if entry.get("type") == self.DELTA and entry.get("id") not in self.__checkpoints:
+                    continue
+                self._apply(entry)
@@ -0,0 +1,344 @@
+import json
+import os
+import re
+import zlib
+from datetime import date
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from src.file_manager import (
+    DECOMPRESSION_ERRORS,
+    FileManager,
+    OperationLog,
+    SalaryRange,
+    VacancyIndex,
+    is_decompression_error,
+    iter_json_array,
+    open_file,
+)
+from src.salary_index import parse_salary, salary_midpoint
+
+
+class PartitionedFileManager(FileManager):
+    """Класс для хранения вакансий в нескольких JSON-файлах (партициях) с манифестом.
+
+    Партиция выбирается по региону и дате сбора (partition_by="area_date") или по хешу url
+    (partition_by="hash"). Манифест хранит для каждой партиции количество строк и минимальную
+    и максимальную середину вилки, что позволяет не читать партиции, которые не подходят под запрос.
+    При разбиении по региону и дате партиция каждой вакансии (url -> партиция) дописывается в журнал
+    locations.jsonl, который загружается при первом изменении хранилища, поэтому вакансия, собранная
+    повторно в другой день, не дублируется, а при изменении заменяется, как и в JSONFileManager.
+    Партиции можно сжимать, указав расширение compression (".gz", ".xz" или ".bz2").
+    """
+
+    MANIFEST = "manifest.json"
+    LOCATIONS = "locations.jsonl"
+    PARTITION_MODES = ("area_date", "hash")
+
+    def __init__(
+        self,
+        directory: str = "data/partitions",
+        partition_by: str = "area_date",
+        num_buckets: int = 16,
+        indexes: Optional[List[VacancyIndex]] = None,
+        today: Callable[[], date] = date.today,
+        compression: str = "",
+    ):
+        """Инициализация объекта PartitionedFileManager. Манифест загружается из каталога, если он есть."""
+        super().__init__(indexes)
+        if partition_by not in self.PARTITION_MODES:
+            raise ValueError(f"Неизвестный способ разбиения: {partition_by}")
+        self.__directory = directory
+        self.__partition_by = partition_by
+        self.__num_buckets = num_buckets
+        self.__today = today
+        self.__compression = compression
+        self.__partitions: Dict[str, Dict[str, Any]] = {}
+        self.__locations: Optional[Dict[str, str]] = None
+        self.__locations_log = (
+            OperationLog(os.path.join(directory, self.LOCATIONS), self._locations_snapshot)
+            if partition_by == "area_date"
+            else None
+        )
+        self._load_manifest()
+
+    @property
+    def directory(self) -> str:
+        return self.__directory
+
+    @property
+    def partitions(self) -> Dict[str, Dict[str, Any]]:
+        return {name: dict(info) for name, info in self.__partitions.items()}
+
+    def get_vacancies(self) -> List[Dict]:
+        """Получает данные из всех партиций."""
+        vacancies: List[Dict] = []
+        for name in sorted(self.__partitions):
+            vacancies.extend(self._read_partition(name))
+        return vacancies
+
+    def iter_vacancies(self) -> Iterator[Dict]:
+        """Перебирает вакансии, читая партиции по одной. Поврежденная партиция вызывает ValueError."""
+        for name in sorted(self.__partitions):
+            yield from self._load_partition(name)
+
+    def get_candidates(
+        self, salary_range: Optional[SalaryRange] = None, areas: Optional[Set[str]] = None
+    ) -> List[Dict]:
+        """Получает вакансии только из партиций, которые по манифесту могут подходить под ограничения."""
+        vacancies: List[Dict] = []
+        for name in sorted(self.__partitions):
+            if self._may_match(self.__partitions[name], salary_range, areas):
+                vacancies.extend(self._read_partition(name))
+        return self._narrow_candidates(vacancies, salary_range, areas)
+
+    def count_vacancies(self) -> int:
+        """Количество вакансий по манифесту, без чтения партиций."""
+        return sum(int(info.get("rows", 0)) for info in self.__partitions.values())
+
+    def write_vacancies(self, vacancies: Iterable[Dict]) -> int:
+        """Потоково записывает вакансии в партиции, заменяя содержимое хранилища (без проверки на дублирование).
+
+        Каждая партиция записывается один раз, а не перезаписывается при добавлении каждой вакансии.
+        """
+        self.clear_file()
+        os.makedirs(self.__directory, exist_ok=True)
+        files: Dict[str, IO[str]] = {}
+        count = 0
+        try:
+            for vacancy in vacancies:
+                name = self._partition_name(vacancy)
+                f = files.get(name)
+                if f is None:
+                    filename = self._partition_file(name)
+                    f = files[name] = open_file(os.path.join(self.__directory, filename), "w")
+                    f.write("[\n")
+                    area = str(vacancy.get("area") or "") if self.__partition_by == "area_date" else ""
+                    self.__partitions[name] = self._empty_stats(filename, area)
+                else:
+                    f.write(",\n")
+                f.write(json.dumps(vacancy, indent=4, ensure_ascii=False))
+                self._update_stats(self.__partitions[name], vacancy)
+                vacancy_id = vacancy.get("url")
+                if vacancy_id and self.__locations_log is not None:
+                    self._locations()[vacancy_id] = name
+                self._notify_add(vacancy)
+                count += 1
+        finally:
+            for f in files.values():
+                f.write("\n]")
+                f.close()
+            self._save_manifest()
+            if self.__locations_log is not None:
+                self.__locations_log.compact()  # Карта вакансий записывается целиком один раз
+        return count
+
+    def add_vacancy(self, vacancy: Dict) -> None:
+        """Добавляет вакансию в ее партицию, не допуская дублирования во всем хранилище.
+
+        Изменившаяся вакансия заменяется; если она была сохранена в партиции другого сбора,
+        то переносится в партицию текущего сбора. Поврежденная партиция не перезаписывается: вызывается ValueError.
+        """
+        vacancy_id = vacancy.get("url")
+        name = self._partition_name(vacancy)
+        located = self._locations().get(vacancy_id) if vacancy_id else None
+        if located in self.__partitions and located != name:  # Вакансия уже сохранена в другой партиции
+            stored = self._load_partition(str(located))
+            if not self._merge_vacancy(vacancy, stored):
+                return
+            remaining = [v for v in stored if v.get("url") != vacancy_id]
+            self._write_partition(str(located), remaining, area=self.__partitions[str(located)].get("area", ""))
+        vacancies = self._load_partition(name) if name in self.__partitions else []
+        if not self._merge_vacancy(vacancy, vacancies):  # Проверка на дублирование
+            return
+        area = str(vacancy.get("area") or "") if self.__partition_by == "area_date" else ""
+        self._write_partition(name, vacancies, area=area)
+        if vacancy_id and located != name:
+            self._set_location(vacancy_id, name)
+        self._notify_add(vacancy)
+
+    def delete_vacancy(self, vacancy_id: str) -> None:
+        """Удаляет информацию о вакансии, перезаписывая только партиции, в которых она была."""
+        if self.__partition_by == "hash":
+            names = [self._bucket_name(vacancy_id)]
+        elif vacancy_id in self._locations():
+            names = [self._locations()[vacancy_id]]
+        else:
+            names = sorted(self.__partitions)
+        for name in names:
+            if name not in self.__partitions:
+                continue
+            vacancies = self._load_partition(name)
+            updated_vacancies = [v for v in vacancies if v.get("url") != vacancy_id]
+            if len(updated_vacancies) != len(vacancies):
+                self._write_partition(name, updated_vacancies, area=self.__partitions[name].get("area", ""))
+        if vacancy_id in self._locations():
+            self._set_location(vacancy_id, None)
+        self._notify_delete(vacancy_id)
+
+    def clear_file(self) -> None:
+        """Удаляет все партиции и очищает манифест."""
+        for info in self.__partitions.values():
+            path = os.path.join(self.__directory, info["file"])
+            if os.path.exists(path):
+                os.remove(path)
+        self.__partitions = {}
+        self._save_manifest()
+        if self.__locations_log is not None:
+            self.__locations = {}
+            self.__locations_log.compact()
+        self._notify_clear()
+
+    def _locations(self) -> Dict[str, str]:
+        """Карта url -> партиция (при разбиении по региону и дате). Загружается из журнала при первом обращении."""
+        if self.__locations is None:
+            self.__locations = {}
+            log = self.__locations_log
+            if log is None:
+                return self.__locations
+            if os.path.exists(log.filename):
+                for record in log.replay():
+                    try:
+                        if record.get("partition"):
+                            self.__locations[record["id"]] = record["partition"]
+                        else:
+                            self.__locations.pop(record["id"], None)
+                    except (AttributeError, KeyError, TypeError):
+                        continue
+            elif self.__partitions:  # Каталог без журнала: строим карту по партициям
+                for name in self.__partitions:
+                    for vacancy in self._read_partition(name):
+                        if vacancy.get("url"):
+                            self.__locations[vacancy["url"]] = name
+                log.compact()
+        return self.__locations
+
+    def _locations_snapshot(self) -> Iterator[Dict[str, str]]:
+        """Записи журнала карты вакансий, описывающие текущее состояние."""
+        for vacancy_id, name in self._locations().items():
+            yield {"id": vacancy_id, "partition": name}
+
+    def _set_location(self, vacancy_id: str, name: Optional[str]) -> None:
+        """Запоминает партицию вакансии (None - вакансия удалена) и дописывает изменение в журнал."""
+        if self.__locations_log is None:
+            return
+        locations = self._locations()
+        if name is None:
+            locations.pop(vacancy_id, None)
+        else:
+            locations[vacancy_id] = name
+        self.__locations_log.append([{"id": vacancy_id, "partition": name}], live=len(locations))
+
+    def _partition_name(self, vacancy: Dict) -> str:
+        """Определяет имя партиции для вакансии."""
+        if self.__partition_by == "hash":
+            return self._bucket_name(str(vacancy.get("url", "")))
+        area = re.sub(r"[^\w-]", "_", str(vacancy.get("area") or "")) or "unknown"
+        return f"area_{area}_{self.__today().isoformat()}"
+
+    def _bucket_name(self, vacancy_id: str) -> str:
+        return f"bucket_{zlib.crc32(vacancy_id.encode('utf-8')) % self.__num_buckets:03d}"
+
+    def _partition_file(self, name: str) -> str:
+        """Имя файла партиции: из манифеста для существующих партиций, иначе с текущим сжатием."""
+        if name in self.__partitions:
+            return str(self.__partitions[name]["file"])
+        return f"{name}.json{self.__compression}"
+
+    def _may_match(self, info: Dict[str, Any], salary_range: Optional[SalaryRange], areas: Optional[Set[str]]) -> bool:
+        """Проверяет по манифесту, могут ли в партиции быть подходящие вакансии."""
+        if areas is not None and self.__partition_by == "area_date" and info.get("area", "") not in areas:
+            return False
+        if salary_range is None:
+            return True
+        if info.get("salary_min") is None:
+            return False
+        low, high = salary_range
+        return (low is None or info["salary_max"] >= low) and (high is None or info["salary_min"] <= high)
+
+    def _read_partition(self, name: str) -> List[Dict[str, Any]]:
+        """Читает вакансии партиции. Поврежденная партиция читается как пустая."""
+        try:
+            return self._load_partition(name)
+        except ValueError:
+            return []
+
+    def _load_partition(self, name: str) -> List[Dict[str, Any]]:
+        """Читает вакансии партиции. Поврежденная партиция вызывает ValueError, чтобы ее не перезаписали."""
+        filename = os.path.join(self.__directory, self._partition_file(name))
+        try:
+            with open_file(filename, "r") as f:
+                data: List[Dict[str, Any]] = list(iter_json_array(f))
+        except FileNotFoundError:
+            return []
+        except json.JSONDecodeError as e:  # Обработка случая поврежденного JSON
+            raise ValueError(f"Партиция {filename} повреждена: {e}") from e
+        except (*DECOMPRESSION_ERRORS, OSError) as e:  # Обработка случая поврежденного сжатого файла
+            if not is_decompression_error(e):  # Ошибки ввода-вывода не выдаются за пустую партицию
+                raise
+            raise ValueError(f"Партиция {filename} повреждена: {e}") from e
+        return data
+
+    def _write_partition(self, name: str, vacancies: List[Dict], area: str) -> None:
+        """Перезаписывает партицию и обновляет ее статистику в манифесте."""
+        os.makedirs(self.__directory, exist_ok=True)
+        filename = self._partition_file(name)
+        path = os.path.join(self.__directory, filename)
+        if not vacancies:
+            if os.path.exists(path):
+                os.remove(path)
+            self.__partitions.pop(name, None)
+            self._save_manifest()
+            return
+        with open_file(path, "w") as f:
+            json.dump(vacancies, f, indent=4, ensure_ascii=False)
+        info = self._empty_stats(filename, area)
+        for vacancy in vacancies:
+            self._update_stats(info, vacancy)
+        self.__partitions[name] = info
+        self._save_manifest()
+
+    @staticmethod
+    def _empty_stats(filename: str, area: str) -> Dict[str, Any]:
+        """Статистика пустой партиции для манифеста."""
+        return {"file": filename, "rows": 0, "salary_min": None, "salary_max": None, "area": area}
+
+    @staticmethod
+    def _update_stats(info: Dict[str, Any], vacancy: Dict) -> None:
+        """Учитывает вакансию в статистике партиции: количество строк и диапазон середины вилки."""
+        info["rows"] += 1
+        midpoint = salary_midpoint(parse_salary(vacancy.get("salary_from")), parse_salary(vacancy.get("salary_to")))
+        if midpoint is not None:
+            info["salary_min"] = midpoint if info["salary_min"] is None else min(info["salary_min"], midpoint)
+            info["salary_max"] = midpoint if info["salary_max"] is None else max(info["salary_max"], midpoint)
+
+    def _load_manifest(self) -> None:
+        """Загружает манифест из каталога. Поврежденный манифест игнорируется."""
+        try:
+            with open(os.path.join(self.__directory, self.MANIFEST), "r", encoding="utf-8") as f:
+                data: Dict[str, Any] = json.load(f)
+        except FileNotFoundError:
+            return
+        except json.JSONDecodeError:
+            return
+        if data.get("partition_by", self.__partition_by) != self.__partition_by:
+            raise ValueError(f"Каталог {self.__directory} разбит способом {data['partition_by']}")
+        if self.__partition_by == "hash" and data.get("num_buckets", self.__num_buckets) != self.__num_buckets:
+            raise ValueError(f"Каталог {self.__directory} разбит на {data['num_buckets']} корзин")
+        self.__partitions = data.get("partitions", {})
+        log = self.__locations_log
+        if log is not None and "locations" in data and not os.path.exists(log.filename):
+            # Манифест прежнего формата хранил карту вакансий: переносим ее в журнал
+            self.__locations = data["locations"]
+            log.compact()
+            self._save_manifest()
+
+    def _save_manifest(self) -> None:
+        """Сохраняет манифест."""
+        os.makedirs(self.__directory, exist_ok=True)
+        data = {
+            "partition_by": self.__partition_by,
+            "num_buckets": self.__num_buckets,
+            "partitions": self.__partitions,
+        }
+        with open(os.path.join(self.__directory, self.MANIFEST), "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
@@ -0,0 +1,336 @@
+import abc
+import re
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.file_manager import FileManager, SalaryRange
+from src.salary_index import parse_salary, salary_midpoint
+from src.vacancy import Vacancy
+
+Predicate = Callable[[Vacancy], bool]
+
+
+class Query(abc.ABC):
+    """Абстрактный класс условия фильтрации вакансий.
+
+    Условия объединяются операторами &, | и ~ и компилируются в один предикат,
+    который проверяет вакансию за один проход.
+    """
+
+    @abc.abstractmethod
+    def compile(self) -> Predicate:
+        """Компилирует условие в функцию-предикат."""
+        pass
+
+    def salary_range(self) -> Optional[SalaryRange]:
+        """Диапазон зарплат, вне которого условие заведомо ложно (None - диапазон не ограничен)."""
+        return None
+
+    def areas(self) -> Optional[Set[str]]:
+        """Регионы, вне которых условие заведомо ложно (None - регион не ограничен)."""
+        return None
+
+    def __and__(self, other: "Query") -> "Query":
+        return AllOf(self, other)
+
+    def __or__(self, other: "Query") -> "Query":
+        return AnyOf(self, other)
+
+    def __invert__(self) -> "Query":
+        return Not(self)
+
+
+class SalaryBetween(Query):
+    """Нормализованная середина вилки лежит в диапазоне [low, high]."""
+
+    def __init__(self, low: Optional[float] = None, high: Optional[float] = None):
+        self.low = low
+        self.high = high
+
+    def compile(self) -> Predicate:
+        low = float("-inf") if self.low is None else self.low
+        high = float("inf") if self.high is None else self.high
+
+        def predicate(vacancy: Vacancy) -> bool:
+            midpoint = salary_midpoint(vacancy.salary_from, vacancy.salary_to)
+            return midpoint is not None and low <= midpoint <= high
+
+        return predicate
+
+    def salary_range(self) -> Optional[SalaryRange]:
+        return self.low, self.high
+
+
+class Keyword(Query):
+    """Ключевое слово (без учета регистра) встречается в одном из полей вакансии."""
+
+    def __init__(self, word: str, fields: Tuple[str, ...] = ("title", "description")):
+        self.word = word
+        self.fields = fields
+
+    def compile(self) -> Predicate:
+        word = self.word.lower()
+        fields = self.fields
+
+        def predicate(vacancy: Vacancy) -> bool:
+            for field in fields:
+                value = getattr(vacancy, field)
+                if value and word in value.lower():
+                    return True
+            return False
+
+        return predicate
+
+
+class TitleRegex(Query):
+    """Название вакансии соответствует регулярному выражению (без учета регистра)."""
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+
+    def compile(self) -> Predicate:
+        search = re.compile(self.pattern, re.IGNORECASE).search
+
+        def predicate(vacancy: Vacancy) -> bool:
+            return bool(vacancy.title) and search(vacancy.title) is not None
+
+        return predicate
+
+
+class Area(Query):
+    """Вакансия относится к одному из регионов (ID hh.ru)."""
+
+    def __init__(self, *area_ids: str):
+        self.area_ids = {str(area_id) for area_id in area_ids}
+
+    def compile(self) -> Predicate:
+        area_ids = self.area_ids
+
+        def predicate(vacancy: Vacancy) -> bool:
+            return vacancy.area in area_ids
+
+        return predicate
+
+    def areas(self) -> Optional[Set[str]]:
+        return set(self.area_ids)
+
+
+class AllOf(Query):
+    """Выполнены все условия."""
+
+    def __init__(self, *queries: Query):
+        self.queries: List[Query] = []
+        for query in queries:
+            # Вложенные AllOf разворачиваются, чтобы предикат оставался плоским
+            self.queries.extend(query.queries if isinstance(query, AllOf) else [query])
+
+    def compile(self) -> Predicate:
+        predicates = tuple(query.compile() for query in self.queries)
+
+        def predicate(vacancy: Vacancy) -> bool:
+            for check in predicates:
+                if not check(vacancy):
+                    return False
+            return True
+
+        return predicate
+
+    def salary_range(self) -> Optional[SalaryRange]:
+        ranges = [r for r in (query.salary_range() for query in self.queries) if r is not None]
+        if not ranges:
+            return None
+        lows = [low for low, _ in ranges if low is not None]
+        highs = [high for _, high in ranges if high is not None]
+        return (max(lows) if lows else None, min(highs) if highs else None)
+
+    def areas(self) -> Optional[Set[str]]:
+        result: Optional[Set[str]] = None
+        for query in self.queries:
+            areas = query.areas()
+            if areas is not None:
+                result = areas if result is None else result & areas
+        return result
+
+
+class AnyOf(Query):
+    """Выполнено хотя бы одно из условий."""
+
+    def __init__(self, *queries: Query):
+        self.queries: List[Query] = []
+        for query in queries:
+            self.queries.extend(query.queries if isinstance(query, AnyOf) else [query])
+
+    def compile(self) -> Predicate:
+        predicates = tuple(query.compile() for query in self.queries)
+
+        def predicate(vacancy: Vacancy) -> bool:
+            for check in predicates:
+                if check(vacancy):
+                    return True
+            return False
+
+        return predicate
+
+    def salary_range(self) -> Optional[SalaryRange]:
+        lows: List[float] = []
+        highs: List[float] = []
+        unbounded_low = unbounded_high = False
+        for query in self.queries:
+            salary_range = query.salary_range()
+            if salary_range is None:
+                return None
+            low, high = salary_range
+            if low is None:
+                unbounded_low = True
+            else:
+                lows.append(low)
+            if high is None:
+                unbounded_high = True
+            else:
+                highs.append(high)
+        return (None if unbounded_low else min(lows), None if unbounded_high else max(highs))
+
+    def areas(self) -> Optional[Set[str]]:
+        result: Set[str] = set()
+        for query in self.queries:
+            areas = query.areas()
+            if areas is None:
+                return None
+            result |= areas
+        return result
+
+
+class Not(Query):
+    """Условие не выполнено."""
+
+    def __init__(self, query: Query):
+        self.query = query
+
+    def compile(self) -> Predicate:
+        check = self.query.compile()
+
+        def predicate(vacancy: Vacancy) -> bool:
+            return not check(vacancy)
+
+        return predicate
+
+
+class MatchAll(Query):
+    """Условие, которому удовлетворяет любая вакансия."""
+
+    def compile(self) -> Predicate:
+        return lambda vacancy: True
+
+
+_TOKEN_RE = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+
+
+def _tokenize(text: str) -> List[str]:
+    """Разбивает строку запроса на лексемы."""
+    tokens: List[str] = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Некорректный запрос: {text[position:]}")
+        opening, closing, quoted, word = match.groups()
+        tokens.append(opening or closing or (f'"{quoted}"' if quoted is not None else word))
+        position = match.end()
+    return tokens
+
+
+def _parse_term(token: str) -> Query:
+    """Создает условие из одной лексемы запроса."""
+    if token.startswith('"'):
+        return Keyword(token[1:-1])
+    name, _, value = token.partition(":")
+    if value and name.lower() == "salary":
+        low, separator, high = value.partition("..")
+        if not separator:
+            raise ValueError(f"Ожидался диапазон salary:ОТ..ДО, получено: {token}")
+        return SalaryBetween(float(low) if low else None, float(high) if high else None)
+    if value and name.lower() == "title":
+        return TitleRegex(value[1:-1] if len(value) > 1 and value.startswith("/") and value.endswith("/") else value)
+    if value and name.lower() == "area":
+        return Area(*value.split(","))
+    return Keyword(token)
+
+
+def parse_query(text: str) -> Query:
+    """Разбирает строку запроса в объект Query.
+
+    Поддерживаются ключевые слова (в том числе в кавычках), операторы AND, OR, NOT и скобки,
+    а также условия salary:ОТ..ДО, title:/регулярное выражение/ и area:ID[,ID...].
+    Соседние условия без оператора объединяются через AND. Регулярное выражение в title: не должно
+    содержать пробелов и скобок - для сложных выражений используйте класс TitleRegex.
+    """
+    tokens = _tokenize(text)
+    position = 0
+
+    def peek() -> Optional[str]:
+        return tokens[position] if position < len(tokens) else None
+
+    def take() -> str:
+        nonlocal position
+        token = tokens[position]
+        position += 1
+        return token
+
+    def parse_or() -> Query:
+        queries = [parse_and()]
+        while peek() == "OR":
+            take()
+            queries.append(parse_and())
+        return queries[0] if len(queries) == 1 else AnyOf(*queries)
+
+    def parse_and() -> Query:
+        queries = [parse_not()]
+        while peek() not in (None, ")", "OR"):
+            if peek() == "AND":
+                take()
+            queries.append(parse_not())
+        return queries[0] if len(queries) == 1 else AllOf(*queries)
+
+    def parse_not() -> Query:
+        token = peek()
+        if token is None:
+            raise ValueError("Неожиданный конец запроса")
+        if token == "NOT":
+            take()
+            return Not(parse_not())
+        if token == "(":
+            take()
+            query = parse_or()
+            if peek() != ")":
+                raise ValueError("Не закрыта скобка в запросе")
+            take()
+            return query
+        if token in (")", "AND", "OR"):
+            raise ValueError(f"Неожиданная лексема в запросе: {token}")
+        return _parse_term(take())
+
+    if not tokens:
+        return MatchAll()
+    query = parse_or()
+    if peek() is not None:
+        raise ValueError(f"Неожиданная лексема в запросе: {peek()}")
+    return query
+
+
+def filter_vacancies(vacancies: Iterable[Vacancy], query: Query) -> Iterator[Vacancy]:
+    """Отбирает вакансии, удовлетворяющие условию, за один проход по потоку."""
+    predicate = query.compile()
+    return (vacancy for vacancy in vacancies if predicate(vacancy))
+
+
+def record_to_vacancy(record: Dict) -> Vacancy:
+    """Создает Vacancy из записи хранилища. Зарплаты приводятся к числам (в CSV они хранятся строками)."""
+    salary_from = parse_salary(record.get("salary_from"))
+    salary_to = parse_salary(record.get("salary_to"))
+    return Vacancy(**{**record, "salary_from": salary_from, "salary_to": salary_to})
+
+
+def search_vacancies(file_manager: FileManager, query: Query) -> List[Vacancy]:
+    """Ищет вакансии в хранилище, передавая ограничения по зарплате и региону в индексы хранилища."""
+    records = file_manager.get_candidates(query.salary_range(), query.areas())
+    return list(filter_vacancies((record_to_vacancy(record) for record in records), query))
@@ -0,0 +1,165 @@
+import csv
+import io
+import itertools
+import json
+import sys
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from src.file_manager import open_file
+from src.vacancy import Vacancy
+
+Row = Dict[str, Any]
+# Функция форматирования пакета строк: (строки, колонки, первый ли это пакет) -> текст
+Formatter = Callable[[List[Row], Sequence[str], bool], str]
+
+# Подписи колонок; "salary" - виртуальная колонка "зарплата от - зарплата до"
+COLUMN_LABELS = {
+    "title": "Название",
+    "url": "Ссылка",
+    "salary": "Зарплата",
+    "salary_from": "Зарплата от",
+    "salary_to": "Зарплата до",
+    "description": "Описание",
+    "area": "Регион",
+}
+
+DEFAULT_COLUMNS = {
+    "text": ("title", "url", "salary", "description"),
+    "table": ("title", "salary", "url"),
+}
+DATA_COLUMNS = ("title", "url", "salary_from", "salary_to", "description", "area")
+
+# Максимальная ширина колонки в таблице, более длинные значения обрезаются
+TABLE_MAX_WIDTH = 60
+
+
+def _value(row: Row, column: str) -> Any:
+    """Значение колонки строки с учетом виртуальной колонки salary."""
+    if column == "salary":
+        return f"{row.get('salary_from', 0)} - {row.get('salary_to', 0)}"
+    value = row.get(column)
+    return "" if value is None else value
+
+
+def _format_text(rows: List[Row], columns: Sequence[str], first: bool) -> str:
+    """Удобочитаемый формат: каждое поле на отдельной строке, вакансии разделены чертой."""
+    parts = []
+    for row in rows:
+        for column in columns:
+            parts.append(f"{COLUMN_LABELS.get(column, column)}: {_value(row, column)}\n")
+        parts.append("-" * 20 + "\n")
+    return "".join(parts)
+
+
+def _make_table_formatter() -> Formatter:
+    """Создает форматтер выровненной таблицы. Ширина колонок определяется по первому пакету."""
+    widths: List[int] = []
+
+    def cell(value: Any, width: int) -> str:
+        text = " ".join(str(value).split())
+        if len(text) > width:
+            text = text[: width - 1] + "…"
+        return text.ljust(width)
+
+    def format_table(rows: List[Row], columns: Sequence[str], first: bool) -> str:
+        lines = []
+        if first:
+            headers = [COLUMN_LABELS.get(column, column) for column in columns]
+            widths[:] = [
+                min(
+                    TABLE_MAX_WIDTH,
+                    max([len(header)] + [len(" ".join(str(_value(row, column)).split())) for row in rows]),
+                )
+                for header, column in zip(headers, columns)
+            ]
+            lines.append(" | ".join(cell(header, width) for header, width in zip(headers, widths)).rstrip())
+            lines.append("-+-".join("-" * width for width in widths))
+        for row in rows:
+            lines.append(
+                " | ".join(cell(_value(row, column), width) for column, width in zip(columns, widths)).rstrip()
+            )
+        return "\n".join(lines) + "\n"
+
+    return format_table
+
+
+def _format_jsonl(rows: List[Row], columns: Sequence[str], first: bool) -> str:
+    """JSON Lines: одна вакансия - один JSON-объект на строке."""
+    return "".join(
+        json.dumps({column: _value(row, column) for column in columns}, ensure_ascii=False) + "\n" for row in rows
+    )
+
+
+def _make_delimited_formatter(delimiter: str) -> Formatter:
+    """Создает форматтер CSV/TSV с заголовком в первом пакете."""
+
+    def format_delimited(rows: List[Row], columns: Sequence[str], first: bool) -> str:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=delimiter, lineterminator="\n")
+        if first:
+            writer.writerow(columns)
+        writer.writerows([_value(row, column) for column in columns] for row in rows)
+        return buffer.getvalue()
+
+    return format_delimited
+
+
+FORMATS: Dict[str, Callable[[], Formatter]] = {
+    "text": lambda: _format_text,
+    "table": _make_table_formatter,
+    "jsonl": lambda: _format_jsonl,
+    "csv": lambda: _make_delimited_formatter(","),
+    "tsv": lambda: _make_delimited_formatter("\t"),
+}
+
+
+def _batches(rows: Iterator[Row], batch_size: int) -> Iterator[List[Row]]:
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def render_vacancies(
+    vacancies: Iterable[Union[Vacancy, Row]],
+    fmt: str = "text",
+    columns: Optional[Sequence[str]] = None,
+    out: Optional[IO[str]] = None,
+    batch_size: int = 1000,
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> int:
+    """Выводит вакансии в выбранном формате (text, table, jsonl, csv, tsv).
+
+    Вакансии форматируются пакетами по batch_size, и каждый пакет записывается в out (по умолчанию stdout)
+    одной операцией записи. offset и limit задают страницу вывода. Возвращает количество выведенных вакансий.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Неизвестный формат вывода: {fmt}. Доступные: {', '.join(FORMATS)}")
+    if batch_size < 1:
+        raise ValueError("batch_size должен быть положительным")
+    formatter = FORMATS[fmt]()
+    selected = tuple(columns) if columns else DEFAULT_COLUMNS.get(fmt, DATA_COLUMNS)
+    stream = out if out is not None else sys.stdout
+    rows = (
+        dict(vacancy) for vacancy in itertools.islice(vacancies, offset, None if limit is None else offset + limit)
+    )
+    count = 0
+    for batch in _batches(rows, batch_size):
+        stream.write(formatter(batch, selected, count == 0))
+        count += len(batch)
+    stream.flush()
+    return count
+
+
+def export_vacancies(
+    vacancies: Iterable[Union[Vacancy, Row]],
+    filename: str,
+    fmt: str = "jsonl",
+    columns: Optional[Sequence[str]] = None,
+    batch_size: int = 1000,
+) -> int:
+    """Записывает вакансии в файл в выбранном формате (сжатие определяется по расширению файла)."""
+    with open_file(filename, "w", newline="") as f:
+        return render_vacancies(vacancies, fmt, columns, out=f, batch_size=batch_size)
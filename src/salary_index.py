@@ -0,0 +1,189 @@
+import bisect
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.file_manager import FileManager, OperationLog, SalaryRange, VacancyIndex
+
+
+def parse_salary(value: Any) -> int:
+    """Приводит значение зарплаты (int, float или строку из CSV) к int, неизвестное значение - 0."""
+    if isinstance(value, bool):
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def salary_midpoint(salary_from: int, salary_to: int) -> Optional[float]:
+    """Нормализованная середина вилки. Если одна из границ равна 0 (неизвестна), берется другая."""
+    if salary_from > 0 and salary_to > 0:
+        return (salary_from + salary_to) / 2
+    if salary_from > 0:
+        return float(salary_from)
+    if salary_to > 0:
+        return float(salary_to)
+    return None
+
+
+class SalaryIndex(VacancyIndex):
+    """Постоянный отсортированный индекс по границам зарплаты и середине вилки.
+
+    Хранит три отсортированных списка пар (значение, id вакансии), поэтому запросы
+    по диапазону и порогу выполняются бинарным поиском. Нулевые (неизвестные) границы в индекс не попадают.
+
+    Файл индекса - журнал операций в формате JSON Lines: добавление и удаление дописывают одну строку,
+    а когда журнал становится заметно длиннее индекса, он переписывается заново (сжатие журнала).
+    """
+
+    FIELDS = ("salary_from", "salary_to", "midpoint")
+
+    def __init__(self, filename: Optional[str] = None):
+        """Инициализация индекса. Если файл индекса уже существует, он загружается."""
+        self.__filename = filename
+        self.__sorted: Dict[str, List[Tuple[float, str]]] = {field: [] for field in self.FIELDS}
+        self.__bounds: Dict[str, Tuple[int, int]] = {}
+        self.__log = OperationLog(filename, self._snapshot) if filename else None
+        if self.__log is not None and os.path.exists(self.__log.filename):
+            self._load(self.__log)
+
+    @property
+    def filename(self) -> Optional[str]:
+        return self.__filename
+
+    def __len__(self) -> int:
+        return len(self.__bounds)
+
+    def __contains__(self, vacancy_id: object) -> bool:
+        return vacancy_id in self.__bounds
+
+    def add(self, vacancy: Dict) -> None:
+        """Добавляет вакансию в индекс (повторное добавление того же id заменяет запись)."""
+        vacancy_id = vacancy.get("url")
+        if not vacancy_id:
+            return
+        if vacancy_id in self.__bounds:
+            self._remove(vacancy_id)
+        bounds = (parse_salary(vacancy.get("salary_from")), parse_salary(vacancy.get("salary_to")))
+        self._insert(vacancy_id, *bounds)
+        self._log({"op": "add", "id": vacancy_id, "bounds": bounds})
+
+    def remove(self, vacancy_id: str) -> None:
+        """Удаляет вакансию из индекса."""
+        if vacancy_id in self.__bounds:
+            self._remove(vacancy_id)
+            self._log({"op": "remove", "id": vacancy_id})
+
+    def clear(self) -> None:
+        """Очищает индекс."""
+        self.__sorted = {field: [] for field in self.FIELDS}
+        self.__bounds = {}
+        self.save()
+
+    def rebuild(self, vacancies: Iterable[Dict]) -> None:
+        """Перестраивает индекс по полному списку вакансий хранилища."""
+        self.__sorted = {field: [] for field in self.FIELDS}
+        self.__bounds = {}
+        for vacancy in vacancies:
+            vacancy_id = vacancy.get("url")
+            if vacancy_id and vacancy_id not in self.__bounds:
+                self.__bounds[vacancy_id] = (
+                    parse_salary(vacancy.get("salary_from")),
+                    parse_salary(vacancy.get("salary_to")),
+                )
+        for vacancy_id, (salary_from, salary_to) in self.__bounds.items():
+            for field, value in self._keys(salary_from, salary_to).items():
+                self.__sorted[field].append((value, vacancy_id))
+        for entries in self.__sorted.values():
+            entries.sort()
+        self.save()
+
+    def query(self, field: str, low: Optional[float] = None, high: Optional[float] = None) -> List[str]:
+        """Возвращает id вакансий, у которых значение поля field лежит в [low, high] (границы включительно)."""
+        if field not in self.__sorted:
+            raise ValueError(f"Неизвестное поле индекса: {field}")
+        entries = self.__sorted[field]
+        start = 0 if low is None else bisect.bisect_left(entries, low, key=lambda entry: entry[0])
+        end = len(entries) if high is None else bisect.bisect_right(entries, high, key=lambda entry: entry[0])
+        return [vacancy_id for _, vacancy_id in entries[start:end]]
+
+    def salary_between(self, low: Optional[float] = None, high: Optional[float] = None) -> List[str]:
+        """Вакансии, у которых нормализованная середина вилки лежит в [low, high]."""
+        return self.query("midpoint", low, high)
+
+    def salary_from_at_least(self, threshold: float) -> List[str]:
+        """Вакансии с известной нижней границей не меньше threshold."""
+        return self.query("salary_from", low=threshold)
+
+    def salary_to_at_most(self, threshold: float) -> List[str]:
+        """Вакансии с известной верхней границей не больше threshold."""
+        return self.query("salary_to", high=threshold)
+
+    def candidate_ids(self, salary_range: SalaryRange) -> Optional[Set[str]]:
+        """Id вакансий, у которых середина вилки лежит в заданном диапазоне."""
+        return set(self.salary_between(*salary_range))
+
+    def attach(self, file_manager: FileManager) -> None:
+        """Перестраивает индекс, если количество вакансий в нем не совпадает с количеством в хранилище."""
+        if len(self) != file_manager.count_vacancies():
+            self.rebuild(file_manager.iter_vacancies())
+
+    def save(self) -> None:
+        """Сохраняет индекс в файл (если он задан), заменяя журнал операций текущим состоянием."""
+        if self.__log is not None:
+            self.__log.compact()
+
+    def _snapshot(self) -> Iterator[Dict[str, Any]]:
+        """Записи журнала, описывающие текущее состояние индекса."""
+        for vacancy_id, bounds in self.__bounds.items():
+            yield {"op": "add", "id": vacancy_id, "bounds": bounds}
+
+    def _log(self, operation: Dict[str, Any]) -> None:
+        """Дописывает операцию в журнал (если файл задан)."""
+        if self.__log is not None:
+            self.__log.append([operation], live=len(self.__bounds))
+
+    def _load(self, log: OperationLog) -> None:
+        """Загружает индекс из журнала операций. Поврежденные строки пропускаются."""
+        for operation in log.replay():
+            try:
+                vacancy_id = operation["id"]
+                if operation["op"] == "add":
+                    salary_from, salary_to = operation["bounds"]
+                    self.__bounds[vacancy_id] = (parse_salary(salary_from), parse_salary(salary_to))
+                else:
+                    self.__bounds.pop(vacancy_id, None)
+            except (KeyError, TypeError, ValueError):
+                continue
+        for vacancy_id, (salary_from, salary_to) in self.__bounds.items():
+            for field, value in self._keys(salary_from, salary_to).items():
+                self.__sorted[field].append((value, vacancy_id))
+        for entries in self.__sorted.values():
+            entries.sort()
+
+    def _keys(self, salary_from: int, salary_to: int) -> Dict[str, float]:
+        """Значения, под которыми вакансия попадает в каждый из отсортированных списков."""
+        keys: Dict[str, float] = {}
+        if salary_from > 0:
+            keys["salary_from"] = salary_from
+        if salary_to > 0:
+            keys["salary_to"] = salary_to
+        midpoint = salary_midpoint(salary_from, salary_to)
+        if midpoint is not None:
+            keys["midpoint"] = midpoint
+        return keys
+
+    def _insert(self, vacancy_id: str, salary_from: int, salary_to: int) -> None:
+        self.__bounds[vacancy_id] = (salary_from, salary_to)
+        for field, value in self._keys(salary_from, salary_to).items():
+            bisect.insort(self.__sorted[field], (value, vacancy_id))
+
+    def _remove(self, vacancy_id: str) -> None:
+        salary_from, salary_to = self.__bounds.pop(vacancy_id)
+        for field, value in self._keys(salary_from, salary_to).items():
+            entries = self.__sorted[field]
+            position = bisect.bisect_left(entries, (value, vacancy_id))
+            if position < len(entries) and entries[position] == (value, vacancy_id):
+                del entries[position]
@@ -1,16 +1,43 @@
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Dict, List, Optional, Sequence, Union
 
 from src.api_client import HeadHunterAPI
-from src.file_manager import JSONFileManager
+from src.dedup import deduplicate
+from src.file_manager import FileManager, JSONFileManager
+from src.query import Keyword, filter_vacancies, record_to_vacancy
+from src.renderer import render_vacancies
 from src.vacancy import Vacancy
 
 
-def get_vacancies_from_hh(search_query: str, area_id: str, num_pages: int = 1) -> List[Vacancy]:
-    """Получает вакансии с hh.ru и возвращает список объектов Vacancy."""
-    hh_api = HeadHunterAPI()
+def get_vacancies_from_hh(
+    search_query: str,
+    area_id: str,
+    num_pages: int = 1,
+    api: Optional[HeadHunterAPI] = None,
+    workers: int = 1,
+) -> List[Vacancy]:
+    """Получает вакансии с hh.ru и возвращает список объектов Vacancy.
+
+    Страницы после первой не запрашиваются сверх количества, которое сообщил API (поле pages).
+    При workers > 1 остальные страницы загружаются параллельно, порядок вакансий сохраняется.
+    """
+    hh_api = api or HeadHunterAPI()
+    first_page = hh_api.get_vacancies(search_query, area_id, 0) if num_pages > 0 else None
+    pages_total = first_page.get("pages") if isinstance(first_page, dict) else None
+    if isinstance(pages_total, int):
+        num_pages = min(num_pages, max(pages_total, 1))
+
+    def fetch(page: int) -> Optional[Dict]:
+        return hh_api.get_vacancies(search_query, area_id, page)
+
+    if workers > 1 and num_pages > 2:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            rest = list(executor.map(fetch, range(1, num_pages)))
+    else:
+        rest = [fetch(page) for page in range(1, num_pages)]
+
     vacancies: List[Vacancy] = []
-    for page in range(num_pages):
-        data = hh_api.get_vacancies(search_query, area_id, page)
+    for data in [first_page] + rest:
         if not data or "items" not in data:
             continue
         for item in data["items"]:
@@ -34,6 +61,11 @@ def create_vacancy_from_hh_item(item: Dict) -> Optional[Vacancy]:
     except (TypeError, KeyError):
         description = ""
 
+    try:
+        area = item["area"]["id"] or ""
+    except (TypeError, KeyError):
+        area = ""
+
     try:
         vacancy = Vacancy(
             title=item["name"],
@@ -41,41 +73,50 @@ def create_vacancy_from_hh_item(item: Dict) -> Optional[Vacancy]:
             salary_from=salary_from,
             salary_to=salary_to,
             description=description,
+            area=str(area),
         )
         return vacancy
     except KeyError:
         return None
 
 
-def display_vacancies(vacancies: List[Vacancy]) -> None:
-    """Выводит информацию о вакансиях в консоль в удобочитаемом формате."""
+def display_vacancies(
+    vacancies: List[Vacancy], fmt: str = "text", columns: Optional[Sequence[str]] = None, out: Optional[IO[str]] = None
+) -> None:
+    """Выводит информацию о вакансиях в консоль в удобочитаемом формате.
+
+    Формат (text, table, jsonl, csv, tsv) и колонки можно выбрать; вывод выполняется пакетами через render_vacancies.
+    """
     if not vacancies:
         print("Нет вакансий для отображения.")
         return
 
-    for vacancy in vacancies:
-        print(f"Название: {vacancy.title}")
-        print(f"Ссылка: {vacancy.url}")
-        print(f"Зарплата: {vacancy.salary_from} - {vacancy.salary_to}")
-        print(f"Описание: {vacancy.description}")
-        print("-" * 20)
+    render_vacancies(vacancies, fmt, columns, out=out)
+
 
+def _get_file_manager(storage: Union[str, FileManager]) -> FileManager:
+    """Возвращает хранилище: переданный FileManager или JSONFileManager для имени файла."""
+    return JSONFileManager(storage) if isinstance(storage, str) else storage
 
-def save_vacancies_to_file(vacancies: List[Vacancy], filename: str) -> None:
-    """Сохраняет список вакансий в JSON-файл."""
-    file_manager = JSONFileManager(filename)
+
+def save_vacancies_to_file(vacancies: List[Vacancy], filename: Union[str, FileManager]) -> None:
+    """Сохраняет список вакансий в JSON-файл или в переданное хранилище FileManager."""
+    file_manager = _get_file_manager(filename)
     for vacancy in vacancies:
         file_manager.add_vacancy(dict(vacancy))
-    print(f"Сохранено {len(vacancies)} вакансий в {filename}")
+    destination = filename if isinstance(filename, str) else type(filename).__name__
+    print(f"Сохранено {len(vacancies)} вакансий в {destination}")
+
 
+def load_vacancies_from_file(filename: Union[str, FileManager]) -> List[Vacancy]:
+    """Загружает список вакансий из JSON-файла (или хранилища FileManager) и преобразует его в объекты Vacancy.
 
-def load_vacancies_from_file(filename: str) -> List[Vacancy]:
-    """Загружает список вакансий из JSON-файла и преобразует его в объекты Vacancy."""
-    file_manager = JSONFileManager(filename)
-    vacancy_data = file_manager.get_vacancies()
+    Файл читается и распаковывается потоково, без загрузки всего текста в память.
+    """
+    file_manager = _get_file_manager(filename)
     vacancies = []
-    for data in vacancy_data:
-        vacancy = Vacancy(**data)  # Создаем Vacancy объект из словаря
+    for data in file_manager.iter_vacancies():
+        vacancy = record_to_vacancy(data)  # Создаем Vacancy объект из словаря
         vacancies.append(vacancy)
     return vacancies
 
@@ -99,15 +140,13 @@ def interact_with_user() -> None:
 
     try:
         n = int(input("Введите количество топ вакансий по зарплате, которые хотите увидеть: "))
-        top_vacancies = sorted(vacancies, reverse=True)[:n]
+        top_vacancies = sorted(deduplicate(vacancies), reverse=True)[:n]  # Без перепостов одной вакансии
         print("\nТоп вакансии по зарплате:")
         display_vacancies(top_vacancies)
     except ValueError:
         print("Некорректный ввод для количества вакансий.")
 
     keyword = input("Введите ключевое слово для поиска в описании: ")
-    keyword_vacancies = [
-        vacancy for vacancy in vacancies if vacancy.description and keyword.lower() in vacancy.description.lower()
-    ]
+    keyword_vacancies = list(filter_vacancies(vacancies, Keyword(keyword, fields=("description",))))
     print(f"\nВакансии с ключевым словом '{keyword}':")
     display_vacancies(keyword_vacancies)
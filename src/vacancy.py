@@ -4,15 +4,24 @@ from typing import Any, Iterator, Tuple
 class Vacancy:
     """Класс для представления вакансии."""
 
-    __slots__ = ("title", "url", "salary_from", "salary_to", "description")
-
-    def __init__(self, title: str, url: str, salary_from: int = 0, salary_to: int = 0, description: str = ""):
+    __slots__ = ("title", "url", "salary_from", "salary_to", "description", "area")
+
+    def __init__(
+        self,
+        title: str,
+        url: str,
+        salary_from: int = 0,
+        salary_to: int = 0,
+        description: str = "",
+        area: str = "",
+    ):
         """Инициализация объекта Vacancy."""
         self.title = title
         self.url = url
         self.salary_from = self._validate_salary(salary_from)
         self.salary_to = self._validate_salary(salary_to)
         self.description = description
+        self.area = area
 
     def __gt__(self, other: object) -> bool:
         """Сравнение вакансий по зарплате (больше)."""
@@ -48,3 +57,4 @@ class Vacancy:
         yield "salary_from", self.salary_from
         yield "salary_to", self.salary_to
         yield "description", self.description
+        yield "area", self.area
@@ -0,0 +1,160 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.aggregates import QuantileSketch, SalaryAggregates, group_by_keywords, group_by_title
+from src.file_manager import JSONFileManager
+
+
+def test_quantile_sketch_accuracy() -> None:
+    """Тест относительной точности квантилей скетча."""
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in range(1, 1001):
+        sketch.add(value * 1000)
+    median = sketch.quantile(0.5)
+    assert median is not None
+    assert abs(median - 500000) / 500000 <= 0.02
+    assert sketch.count == 1000
+
+
+def test_quantile_sketch_merge_and_remove() -> None:
+    """Тест объединения скетчей и удаления значений."""
+    left, right = QuantileSketch(), QuantileSketch()
+    left.add(100)
+    right.add(300)
+    left.merge(right)
+    assert left.count == 2
+    left.remove(300)
+    assert left.quantile(1) == pytest.approx(100, rel=0.01)
+    with pytest.raises(ValueError):
+        left.remove(300)
+    with pytest.raises(ValueError):
+        left.merge(QuantileSketch(relative_accuracy=0.05))
+
+
+def test_quantile_sketch_serialization() -> None:
+    """Тест сохранения и восстановления скетча."""
+    sketch = QuantileSketch()
+    for value in (100, 200, 300):
+        sketch.add(value)
+    restored = QuantileSketch.from_dict(sketch.to_dict())
+    assert restored.count == 3
+    assert restored.quantile(0.5) == sketch.quantile(0.5)
+    assert QuantileSketch().quantile(0.5) is None
+
+
+def test_group_keys() -> None:
+    """Тест функций группировки."""
+    vacancy = {"title": "  Python  Developer ", "description": "Django и SQL"}
+    assert group_by_title(vacancy) == ["python developer"]
+    assert group_by_keywords(["python", "sql", "java"])(vacancy) == ["python", "sql"]
+
+
+def test_salary_aggregates_add_and_remove(tmpdir: Path) -> None:
+    """Тест обновления агрегатов при изменениях в хранилище."""
+    aggregates = SalaryAggregates(str(tmpdir / "aggregates.json"))
+    file_manager = JSONFileManager(str(tmpdir / "vacancies.json"), indexes=[aggregates])
+    file_manager.add_vacancy({"title": "Python", "url": "url1", "salary_from": 100000, "salary_to": 200000})
+    file_manager.add_vacancy({"title": "python", "url": "url2", "salary_from": 50000, "salary_to": 0})
+    file_manager.add_vacancy({"title": "Java", "url": "url3", "salary_from": 0, "salary_to": 0})
+    stats = aggregates.stats("python")
+    assert stats is not None
+    assert stats["count"] == 2
+    assert stats["mean"] == 100000
+    assert aggregates.groups == ["python"]
+
+    file_manager.delete_vacancy("url1")
+    assert aggregates.report(quantiles=(0.5,)) == {
+        "python": {"count": 1, "mean": 50000, "p50": pytest.approx(50000, rel=0.01)}
+    }
+    file_manager.clear_file()
+    assert aggregates.report() == {}
+
+
+def test_salary_aggregates_persistence(tmpdir: Path) -> None:
+    """Тест загрузки агрегатов из файла и удаления после загрузки."""
+    filename = str(tmpdir / "aggregates.json")
+    aggregates = SalaryAggregates(filename, group_by=group_by_keywords(["python", "django"]))
+    aggregates.add({"title": "Python", "url": "url1", "salary_from": 100000, "description": "Django"})
+    aggregates.add({"title": "Python", "url": "url2", "salary_from": 300000})
+    loaded = SalaryAggregates(filename, group_by=group_by_keywords(["python", "django"]))
+    assert loaded.report() == aggregates.report()
+    loaded.remove("url1")
+    assert loaded.groups == ["python"]
+
+
+def test_salary_aggregates_contributions_log(tmpdir: Path) -> None:
+    """Тест хранения вкладов вакансий в отдельном журнале, который дописывается при изменениях."""
+    filename = str(tmpdir / "aggregates.json")
+    aggregates = SalaryAggregates(filename)
+    for number in range(3):
+        aggregates.add({"title": "Python", "url": f"url{number}", "salary_from": 100000})
+    aggregates.remove("url0")
+    with open(str(aggregates.contributions_filename), encoding="utf-8") as f:
+        assert len(f.readlines()) == 4
+    loaded = SalaryAggregates(filename)
+    assert (loaded.stats("python") or {})["count"] == 2
+    loaded.remove("url1")
+    assert (SalaryAggregates(filename).stats("python") or {})["count"] == 1
+
+
+def test_salary_aggregates_replace_and_rebuild() -> None:
+    """Тест замены вклада вакансии и полного пересчета."""
+    aggregates = SalaryAggregates()
+    aggregates.add({"title": "Python", "url": "url1", "salary_from": 100000})
+    aggregates.add({"title": "Python", "url": "url1", "salary_from": 200000})
+    assert (aggregates.stats("python") or {})["mean"] == 200000
+    aggregates.rebuild([{"title": "Go", "url": "url1", "salary_from": 100}])
+    assert aggregates.groups == ["go"]
+    assert aggregates.stats("python") is None
+
+
+def test_salary_aggregates_appends_group_deltas(tmpdir: Path) -> None:
+    """Тест того, что изменения дописываются в файл агрегатов, а снимок групп переписывается только flush()."""
+    filename = str(tmpdir / "aggregates.json")
+    aggregates = SalaryAggregates(filename)
+    for number in range(3):
+        aggregates.add({"title": "Python", "url": f"url{number}", "salary_from": 100000 * (number + 1)})
+    aggregates.remove("url0")
+    aggregates.add({"title": "Java", "url": "url3", "salary_from": 0})
+    with open(filename, encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert lines[0] == {"relative_accuracy": 0.01}
+    assert lines[1]["group"] == "python"
+    assert [line["sign"] for line in lines[2:]] == [1, 1, -1]
+    assert SalaryAggregates(filename).report() == aggregates.report()
+    aggregates.flush()
+    with open(filename, encoding="utf-8") as f:
+        assert len(f.readlines()) == 2
+    assert SalaryAggregates(filename).report() == aggregates.report()
+
+
+def test_salary_aggregates_legacy_file(tmpdir: Path) -> None:
+    """Тест загрузки файла агрегатов прежнего формата (один JSON-объект со всеми группами)."""
+    filename = str(tmpdir / "aggregates.json")
+    aggregates = SalaryAggregates()
+    aggregates.add({"title": "Python", "url": "url1", "salary_from": 100000})
+    sketch = QuantileSketch()
+    sketch.add(100000)
+    with open(filename, "w", encoding="utf-8") as f:
+        groups = {"python": {"count": 1, "total": 100000, "sketch": sketch.to_dict()}}
+        json.dump({"relative_accuracy": 0.01, "groups": groups}, f)
+    assert SalaryAggregates(filename).report() == aggregates.report()
+
+
+def test_salary_aggregates_attach_rebuilds(tmpdir: Path) -> None:
+    """Тест пересчета агрегатов, подключенных к хранилищу, в котором уже есть вакансии."""
+    file_manager = JSONFileManager(str(tmpdir / "vacancies.json"))
+    file_manager.add_vacancy({"title": "Python", "url": "url1", "salary_from": 100000})
+    file_manager.add_vacancy({"title": "Java", "url": "url2"})
+    aggregates = SalaryAggregates(str(tmpdir / "aggregates.json"))
+    aggregates.attach(file_manager)
+    assert aggregates.groups == ["python"]
+    assert len(aggregates) == 2
+    loaded = SalaryAggregates(str(tmpdir / "aggregates.json"))
+    with patch.object(loaded, "rebuild") as rebuild:
+        loaded.attach(file_manager)
+    rebuild.assert_not_called()
+    assert loaded.report() == aggregates.report()
@@ -100,3 +100,41 @@ def test_get_vacancies_parameterized(
             assert False, "Vacancies не должно быть None при expected_count > 0"
     else:
         assert vacancies is not None and vacancies["items"] == mock_response["items"]
+
+
+# Тест повтора запроса при ответе 503 (мокируем requests.get и time.sleep)
+@patch("src.api_client.time.sleep")
+@patch("requests.get")
+def test_get_vacancies_retry_on_server_error(mock_get: MagicMock, mock_sleep: MagicMock) -> None:
+    failed = MagicMock(status_code=503, headers={})
+    succeeded = MagicMock(status_code=200)
+    succeeded.json.return_value = {"items": []}
+    mock_get.side_effect = [failed, succeeded]
+    api = HeadHunterAPI(max_retries=1, backoff=0.5)
+    assert api.get_vacancies("Python", "113") == {"items": []}
+    assert api.retry_count == 1
+    mock_sleep.assert_called_once_with(0.5)
+
+
+# Тест повтора запроса при ошибке соединения (мокируем requests.get и time.sleep)
+@patch("src.api_client.time.sleep")
+@patch("requests.get")
+def test_get_vacancies_retry_on_connection_error(mock_get: MagicMock, mock_sleep: MagicMock) -> None:
+    mock_get.side_effect = requests.exceptions.ConnectionError("Connection error")
+    api = HeadHunterAPI(max_retries=2, backoff=0.1)
+    assert api.get_vacancies("Python", "113") is None
+    assert mock_get.call_count == 3
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.1, 0.2]
+
+
+# Тест ограничения паузы из заголовка Retry-After (мокируем requests.get и time.sleep)
+@patch("src.api_client.time.sleep")
+@patch("requests.get")
+def test_get_vacancies_retry_after_is_capped(mock_get: MagicMock, mock_sleep: MagicMock) -> None:
+    rate_limited = MagicMock(status_code=429, headers={"Retry-After": "86400"})
+    succeeded = MagicMock(status_code=200)
+    succeeded.json.return_value = {"items": []}
+    mock_get.side_effect = [rate_limited, succeeded]
+    api = HeadHunterAPI(max_retries=1, max_delay=5.0)
+    assert api.get_vacancies("Python", "113") == {"items": []}
+    mock_sleep.assert_called_once_with(5.0)
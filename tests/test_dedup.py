@@ -0,0 +1,152 @@
+import random
+import string
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from src.dedup import NearDuplicateDetector, choose_bands, deduplicate, normalize_text, shingles
+from src.file_manager import JSONFileManager
+from src.vacancy import Vacancy
+
+DESCRIPTION = (
+    "Опыт коммерческой разработки на <highlighttext>Python</highlighttext> от 3 лет. "
+    "Знание Django, PostgreSQL, Docker. Умение писать тесты и работать в команде."
+)
+
+
+@pytest.fixture
+def original() -> Dict:
+    """Фикстура для создания исходной вакансии."""
+    return {"title": "Python-разработчик", "url": "https://hh.ru/vacancy/1", "description": DESCRIPTION}
+
+
+@pytest.fixture
+def repost() -> Dict:
+    """Фикстура для создания перепоста той же вакансии агентством."""
+    return {
+        "title": "Python разработчик (Middle)",
+        "url": "https://hh.ru/vacancy/2",
+        "description": DESCRIPTION.replace("<highlighttext>Python</highlighttext>", "Python"),
+    }
+
+
+@pytest.fixture
+def other() -> Dict:
+    """Фикстура для создания другой вакансии."""
+    return {
+        "title": "Бухгалтер",
+        "url": "https://hh.ru/vacancy/3",
+        "description": "Ведение первичной документации, 1С: Бухгалтерия, сдача отчетности.",
+    }
+
+
+def test_normalize_text_and_shingles() -> None:
+    """Тест нормализации текста и построения шинглов."""
+    assert normalize_text("<highlighttext>Python</highlighttext>-разработчик!") == "python разработчик"
+    assert shingles("") == set()
+    assert len(shingles("abc", size=5)) == 1
+    assert len(shingles("abcdef", size=5)) == 2
+
+
+def test_choose_bands() -> None:
+    """Тест подбора параметров LSH."""
+    bands, rows = choose_bands(128, 0.8)
+    assert (bands, rows) == (16, 8)
+    assert (1 / bands) ** (1 / rows) <= 0.8
+    assert choose_bands(128, 0.001) == (128, 1)
+
+
+def test_detector_recall_just_above_threshold() -> None:
+    """Тест того, что пары со сходством Жаккара чуть выше порога находятся почти всегда."""
+    rng = random.Random(3)
+    found = total = 0
+    while total < 50:
+        words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(60)]
+        changed = list(words)
+        for position in rng.sample(range(len(words)), 2):
+            changed[position] = "".join(rng.choices(string.ascii_lowercase, k=6))
+        text, similar_text = " ".join(words), " ".join(changed)
+        similarity = len(shingles(text) & shingles(similar_text)) / len(shingles(text) | shingles(similar_text))
+        if not 0.85 <= similarity <= 0.95:
+            continue
+        detector = NearDuplicateDetector(threshold=0.8)
+        detector.add({"title": text, "url": "url1"})
+        found += bool(detector.find_duplicates({"title": similar_text, "url": "url2"}))
+        total += 1
+    assert found / total >= 0.95
+
+
+def test_detector_clusters_near_duplicates(original: Dict, repost: Dict, other: Dict) -> None:
+    """Тест объединения перепостов в один кластер."""
+    detector = NearDuplicateDetector(threshold=0.7)
+    for vacancy in (original, repost, other):
+        detector.add(vacancy)
+    assert detector.cluster_id(repost["url"]) == original["url"]
+    assert detector.cluster_id(other["url"]) == other["url"]
+    assert detector.clusters() == {original["url"]: [original["url"], repost["url"]], other["url"]: [other["url"]]}
+    duplicates = detector.find_duplicates({**repost, "url": "new"})
+    assert [vacancy_id for vacancy_id, _ in duplicates] == [repost["url"], original["url"]]
+    assert duplicates[0][1] == 1.0
+
+
+def test_detector_remove_and_empty_text(original: Dict, repost: Dict) -> None:
+    """Тест удаления вакансии и вакансий без текста."""
+    detector = NearDuplicateDetector(threshold=0.7)
+    detector.add(original)
+    detector.remove(original["url"])
+    detector.add(repost)
+    assert detector.cluster_id(repost["url"]) == repost["url"]
+    detector.add({"url": "empty1"})
+    detector.add({"url": "empty2"})
+    assert detector.cluster_id("empty2") == "empty2"
+    assert len(detector) == 3
+
+
+def test_detector_persistence(tmpdir: Path, original: Dict, repost: Dict) -> None:
+    """Тест загрузки сигнатур и кластеров из файла."""
+    filename = str(tmpdir / "dedup.jsonl")
+    detector = NearDuplicateDetector(filename, threshold=0.7)
+    detector.add(original)
+    loaded = NearDuplicateDetector(filename, threshold=0.7)
+    loaded.add(repost)
+    assert loaded.cluster_id(repost["url"]) == original["url"]
+    with pytest.raises(ValueError):
+        NearDuplicateDetector(filename, threshold=0.9)
+
+
+def test_detector_appends_changes(tmpdir: Path, original: Dict, repost: Dict, other: Dict) -> None:
+    """Тест журнала: добавление и удаление дописывают строку, а не переписывают файл целиком."""
+    filename = str(tmpdir / "dedup.jsonl")
+    detector = NearDuplicateDetector(filename, threshold=0.7)
+    for vacancy in (original, repost, other):
+        detector.add(vacancy)
+    detector.remove(other["url"])
+    with open(filename, encoding="utf-8") as f:
+        assert len(f.readlines()) == 5  # Параметры, три вакансии и удаление
+    loaded = NearDuplicateDetector(filename, threshold=0.7)
+    assert loaded.clusters() == {original["url"]: [original["url"], repost["url"]]}
+    assert loaded.find_duplicates(repost) == detector.find_duplicates(repost)
+
+
+def test_detector_maintained_by_file_manager(tmpdir: Path, original: Dict, repost: Dict) -> None:
+    """Тест назначения кластеров при сохранении в хранилище."""
+    detector = NearDuplicateDetector(threshold=0.7)
+    file_manager = JSONFileManager(str(tmpdir / "vacancies.json"), indexes=[detector])
+    file_manager.add_vacancy(original)
+    file_manager.add_vacancy(repost)
+    assert detector.cluster_id(repost["url"]) == original["url"]
+    file_manager.clear_file()
+    assert len(detector) == 0
+
+
+def test_deduplicate(original: Dict, repost: Dict, other: Dict) -> None:
+    """Тест удаления перепостов из списка вакансий."""
+    vacancies = [Vacancy(**original), Vacancy(**repost), Vacancy(**other)]
+    assert [v.url for v in deduplicate(vacancies, threshold=0.7)] == [original["url"], other["url"]]
+
+
+def test_deduplicate_keeps_highest_salary(original: Dict, repost: Dict, other: Dict) -> None:
+    """Тест выбора вакансии с самой высокой зарплатой из кластера перепостов."""
+    vacancies = [Vacancy(**original, salary_from=100000), Vacancy(**repost, salary_from=150000), Vacancy(**other)]
+    assert [v.url for v in deduplicate(vacancies, threshold=0.7)] == [repost["url"], other["url"]]
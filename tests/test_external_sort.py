@@ -0,0 +1,126 @@
+import os
+import random
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from src.external_sort import export_sorted, external_sort, make_sort_key
+from src.file_manager import CSVFileManager, JSONFileManager
+from src.partitioned_store import PartitionedFileManager
+from src.salary_index import SalaryIndex
+
+
+@pytest.fixture
+def vacancies() -> List[Dict]:
+    """Фикстура для создания перемешанного списка вакансий."""
+    records = [
+        {"title": f"Vacancy {i:03d}", "url": f"url{i}", "salary_from": (i * 37) % 100 * 1000, "salary_to": 0}
+        for i in range(200)
+    ]
+    random.Random(1).shuffle(records)
+    return records
+
+
+def test_make_sort_key() -> None:
+    """Тест ключа сортировки по нескольким полям с разным направлением."""
+    records: List[Dict] = [
+        {"title": "b", "salary_from": 100},
+        {"title": "a", "salary_from": "100"},
+        {"title": "c", "salary_from": 300},
+    ]
+    assert [r["title"] for r in sorted(records, key=make_sort_key(["-salary_from", "title"]))] == ["c", "a", "b"]
+    assert [r["title"] for r in sorted(records, key=make_sort_key(["-title"]))] == ["c", "b", "a"]
+    with pytest.raises(ValueError):
+        make_sort_key([])
+
+
+def test_external_sort_in_memory(vacancies: List[Dict]) -> None:
+    """Тест сортировки, которая помещается в память."""
+    result = list(external_sort(vacancies, sort_by=["salary_from", "title"]))
+    assert result == sorted(vacancies, key=lambda v: (v["salary_from"], v["title"]))
+
+
+def test_external_sort_spills_to_disk(tmpdir: Path, vacancies: List[Dict]) -> None:
+    """Тест сортировки со сбросом серий на диск и многопроходным слиянием."""
+    temp_dir = str(tmpdir / "runs")
+    os.makedirs(temp_dir)
+    result = external_sort(vacancies, sort_by=["-salary_from"], memory_limit=500, max_open_runs=3, temp_dir=temp_dir)
+    first = next(result)
+    assert len(os.listdir(temp_dir)) > 0
+    rest = list(result)
+    # Устойчивая сортировка: при равной зарплате сохраняется исходный порядок
+    assert [first] + rest == sorted(vacancies, key=lambda v: -v["salary_from"])
+    assert os.listdir(temp_dir) == []
+
+
+def test_external_sort_invalid_fan_in(vacancies: List[Dict]) -> None:
+    """Тест некорректного количества одновременно сливаемых серий."""
+    with pytest.raises(ValueError):
+        list(external_sort(vacancies, max_open_runs=1))
+
+
+@pytest.mark.parametrize("destination_name", ["sorted.json", "sorted.csv.gz"])
+def test_export_sorted(tmpdir: Path, vacancies: List[Dict], destination_name: str) -> None:
+    """Тест экспорта хранилища в отсортированном виде в другой формат."""
+    source = JSONFileManager(str(tmpdir / "vacancies.json"))
+    source.write_vacancies(vacancies)
+    destination_path = str(tmpdir / destination_name)
+    destination = (
+        JSONFileManager(destination_path) if ".json" in destination_name else CSVFileManager(destination_path)
+    )
+    count = export_sorted(source, destination, sort_by=["-salary_from", "title"], memory_limit=1000)
+    assert count == 200
+    exported = destination.get_vacancies()
+    assert [v["url"] for v in exported] == [
+        v["url"] for v in sorted(vacancies, key=lambda v: (-v["salary_from"], v["title"]))
+    ]
+
+
+@pytest.mark.parametrize("memory_limit", [1000, 64 * 1024 * 1024])
+def test_export_sorted_onto_itself(tmpdir: Path, vacancies: List[Dict], memory_limit: int) -> None:
+    """Тест экспорта хранилища самого в себя: источник не очищается до того, как прочитан."""
+    store = JSONFileManager(str(tmpdir / "vacancies.json"))
+    store.write_vacancies(vacancies)
+    assert export_sorted(store, store, sort_by=["url"], memory_limit=memory_limit) == 200
+    assert [v["url"] for v in store.get_vacancies()] == sorted(v["url"] for v in vacancies)
+
+
+def test_export_sorted_to_partitioned_store(tmpdir: Path, vacancies: List[Dict]) -> None:
+    """Тест экспорта в хранилище с партициями: каждая партиция записывается один раз."""
+    source = JSONFileManager(str(tmpdir / "vacancies.json"))
+    source.write_vacancies(vacancies)
+    destination = PartitionedFileManager(str(tmpdir / "partitions"), partition_by="hash", num_buckets=4)
+    with patch.object(destination, "add_vacancy") as add_vacancy:
+        assert export_sorted(source, destination, sort_by=["-salary_from"], memory_limit=1000) == 200
+        add_vacancy.assert_not_called()
+    assert destination.count_vacancies() == 200
+    assert sorted(v["url"] for v in destination.get_vacancies()) == sorted(v["url"] for v in vacancies)
+    salaries = [v["salary_from"] for v in destination.get_vacancies()[:10]]
+    assert salaries == sorted(salaries, reverse=True)
+
+
+def test_export_sorted_raises_on_corrupted_source(tmpdir: Path, vacancies: List[Dict]) -> None:
+    """Тест того, что поврежденный источник не экспортируется как допустимый и не портит destination."""
+    source_path = str(tmpdir / "vacancies.json")
+    JSONFileManager(source_path).write_vacancies(vacancies)
+    with open(source_path, "r+", encoding="utf-8") as f:
+        f.truncate(os.path.getsize(source_path) // 2)
+    destination = CSVFileManager(str(tmpdir / "sorted.csv"))
+    destination.write_vacancies(vacancies[:3])
+    with pytest.raises(ValueError):
+        export_sorted(JSONFileManager(source_path), destination, sort_by=["url"])
+    assert len(destination.get_vacancies()) == 3
+
+
+def test_csv_write_vacancies_keeps_destination_on_error(tmpdir: Path, vacancies: List[Dict]) -> None:
+    """Тест того, что ошибка записи CSV-файла не обрезает прежнее содержимое и не оставляет временных файлов."""
+    index = SalaryIndex()
+    destination = CSVFileManager(str(tmpdir / "sorted.csv.gz"), indexes=[index])
+    destination.write_vacancies(vacancies[:3])
+    with pytest.raises(ValueError):
+        destination.write_vacancies([vacancies[0], {**vacancies[1], "unknown_field": 1}])
+    assert [v["url"] for v in destination.get_vacancies()] == [v["url"] for v in vacancies[:3]]
+    assert len(index) == 3
+    assert os.listdir(str(tmpdir)) == ["sorted.csv.gz"]
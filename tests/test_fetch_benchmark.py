@@ -0,0 +1,91 @@
+from typing import Generator
+
+import pytest
+import requests
+
+from src.api_client import HeadHunterAPI
+from src.fetch_benchmark import format_report, percentile, run_fetch_benchmark
+from src.hh_simulator import SimulatedHHServer
+from src.utils import get_vacancies_from_hh
+
+
+@pytest.fixture
+def hh_server() -> Generator[SimulatedHHServer, None, None]:
+    """Фикстура для запуска локального имитатора hh.ru."""
+    with SimulatedHHServer(found=450, max_depth=400) as server:
+        yield server
+
+
+def test_simulator_vacancies_page(hh_server: SimulatedHHServer) -> None:
+    """Тест формата ответа имитатора и ограничения глубины выдачи."""
+    response = requests.get(
+        f"{hh_server.base_url}/vacancies", params={"text": "python", "page": "1", "per_page": "100"}
+    )
+    data = response.json()
+    assert response.status_code == 200
+    assert data["pages"] == 4
+    assert len(data["items"]) == 100
+    assert data["items"][0]["alternate_url"] == "https://hh.ru/vacancy/100"
+    response = requests.get(f"{hh_server.base_url}/vacancies", params={"page": 4, "per_page": 100})
+    assert response.status_code == 400
+    assert hh_server.stats["bad_request"] == 1
+
+
+def test_client_uses_base_url(hh_server: SimulatedHHServer) -> None:
+    """Тест направления клиента на имитатор и учета числа страниц из ответа."""
+    api = HeadHunterAPI(base_url=hh_server.base_url + "/")
+    api._connect()
+    assert api.base_url == hh_server.base_url
+    vacancies = get_vacancies_from_hh("python", "1", num_pages=10, api=api, workers=4)
+    assert len(vacancies) == 400
+    assert [v.url for v in vacancies[:2]] == ["https://hh.ru/vacancy/0", "https://hh.ru/vacancy/1"]
+    assert vacancies[0].area == "1"
+    assert hh_server.stats["bad_request"] == 0
+
+
+def test_client_retries_rate_limited_requests() -> None:
+    """Тест повторов при ответах 429 с заголовком Retry-After."""
+    with SimulatedHHServer(rate_limit_rate=1.0, retry_after=0.01) as server:
+        api = HeadHunterAPI(base_url=server.base_url, max_retries=2)
+        assert api.get_vacancies("python", "113") is None
+        assert api.retry_count == 2
+        assert server.stats["rate_limited"] == 3
+
+
+def test_simulator_partial_last_page() -> None:
+    """Тест того, что все объявленные страницы отдаются, когда глубина выдачи не кратна размеру страницы."""
+    with SimulatedHHServer(found=1000, max_depth=450) as server:
+        vacancies = get_vacancies_from_hh("python", "1", num_pages=10, api=HeadHunterAPI(base_url=server.base_url))
+        assert len(vacancies) == 450
+        assert server.stats["bad_request"] == 0
+
+
+def test_simulator_invalid_distribution() -> None:
+    """Тест неизвестного распределения задержки."""
+    with pytest.raises(ValueError):
+        SimulatedHHServer(latency_distribution="pareto")
+
+
+def test_percentile() -> None:
+    """Тест вычисления перцентилей."""
+    assert percentile([], 50) == 0.0
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert percentile(list(range(1, 101)), 99) == 99
+
+
+def test_run_fetch_benchmark() -> None:
+    """Тест замеров для стратегий загрузки на имитаторе с ошибками и задержками."""
+    with SimulatedHHServer(
+        found=1000, latency=0.001, latency_distribution="exponential", error_rate=0.2, seed=3
+    ) as server:
+        report = run_fetch_benchmark(
+            server.base_url, num_pages=5, strategies={"sequential": 1, "threaded": 4}, max_retries=5, backoff=0.001
+        )
+    assert set(report) == {"sequential", "threaded"}
+    for stats in report.values():
+        assert stats["pages"] == 5
+        assert stats["vacancies"] == 500
+        assert stats["failed_pages"] == 0
+        assert stats["p99_latency"] >= stats["p50_latency"] > 0
+    assert sum(stats["retries"] for stats in report.values()) > 0
+    assert "sequential" in format_report(report)
@@ -1,10 +1,20 @@
+import gzip
+import json
 import os
 from pathlib import Path
 from typing import Any, Dict, List, Type
+from unittest.mock import patch
 
 import pytest
 
-from src.file_manager import CSVFileManager, FileManager, JSONFileManager
+from src.file_manager import (
+    CSVFileManager,
+    FileManager,
+    JSONFileManager,
+    OperationLog,
+    iter_json_array,
+    open_file,
+)
 
 # --- Тесты для JSONFileManager ---
 
@@ -27,6 +37,23 @@ def test_json_file_manager_add_duplicate_vacancy(json_file_manager: JSONFileMana
     assert len(vacancies) == 1  # Убеждаемся, что дубликат не добавлен
 
 
+def test_json_file_manager_duplicate_by_url(json_file_manager: JSONFileManager) -> None:
+    """Тест проверки дублирования по url: запись из старого архива без новых полей не дублируется."""
+    json_file_manager.add_vacancy({"title": "Test Vacancy", "url": "test_url", "salary_from": 100})
+    json_file_manager.add_vacancy({"title": "Test Vacancy", "url": "test_url", "salary_from": 100, "area": "1"})
+    assert len(json_file_manager.get_vacancies()) == 1
+
+
+def test_json_file_manager_replaces_changed_vacancy(json_file_manager: JSONFileManager) -> None:
+    """Тест замены вакансии, сохраненной повторно с измененной зарплатой."""
+    json_file_manager.add_vacancy({"title": "Test Vacancy", "url": "test_url", "salary_from": 100})
+    json_file_manager.add_vacancy({"title": "Other", "url": "other_url"})
+    json_file_manager.add_vacancy({"title": "Test Vacancy", "url": "test_url", "salary_from": 200})
+    vacancies = json_file_manager.get_vacancies()
+    assert [v["url"] for v in vacancies] == ["test_url", "other_url"]
+    assert vacancies[0]["salary_from"] == 200
+
+
 def test_json_file_manager_get_vacancies(json_file_manager: JSONFileManager) -> None:
     """Тест получения вакансий из JSON-файла."""
     vacancy1 = {"title": "Test Vacancy 1", "url": "test_url_1"}
@@ -116,6 +143,21 @@ def test_csv_file_manager_add_duplicate_vacancy(csv_file_manager: CSVFileManager
     assert len(vacancies) == 1  # Убеждаемся, что дубликат не добавлен
 
 
+def test_csv_file_manager_duplicate_with_numeric_salary(csv_file_manager: CSVFileManager) -> None:
+    """Тест дублирования вакансии с числовой зарплатой, которая в CSV читается строкой."""
+    vacancy = {"title": "Test Vacancy", "url": "test_url", "salary_from": 100}
+    csv_file_manager.add_vacancy(vacancy)
+    csv_file_manager.add_vacancy(vacancy)
+    assert len(csv_file_manager.get_vacancies()) == 1
+
+
+def test_csv_file_manager_replaces_changed_vacancy(csv_file_manager: CSVFileManager) -> None:
+    """Тест замены вакансии, сохраненной повторно с измененной зарплатой."""
+    csv_file_manager.add_vacancy({"title": "Test Vacancy", "url": "test_url", "salary_from": 100})
+    csv_file_manager.add_vacancy({"title": "Test Vacancy", "url": "test_url", "salary_from": 200})
+    assert csv_file_manager.get_vacancies() == [{"title": "Test Vacancy", "url": "test_url", "salary_from": "200"}]
+
+
 def test_csv_file_manager_get_vacancies(csv_file_manager: CSVFileManager) -> None:
     """Тест получения вакансий из CSV-файла."""
     vacancy1 = {"title": "Test Vacancy 1", "url": "test_url_1"}
@@ -186,3 +228,181 @@ def test_file_manager_creation(tmpdir: Path, filename: str, file_manager_class:
     file_path = Path(tmpdir).joinpath(filename)  # Path должен быть Path-объектом
     file_manager = file_manager_class(str(file_path))  # type: ignore
     assert isinstance(file_manager, (JSONFileManager, CSVFileManager))
+
+
+# --- Тесты для сжатых файлов ---
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".xz", ".bz2"])
+def test_json_file_manager_compressed(tmpdir: Path, suffix: str) -> None:
+    """Тест чтения и записи сжатого JSON-файла."""
+    filename = str(tmpdir / f"test_vacancies.json{suffix}")
+    json_file_manager = JSONFileManager(filename)
+    json_file_manager.add_vacancy({"title": "Тестовая вакансия", "url": "test_url_1"})
+    json_file_manager.add_vacancy({"title": "Test Vacancy 2", "url": "test_url_2"})
+    json_file_manager.delete_vacancy("test_url_2")
+    with open(filename, "rb") as f:
+        assert not f.read().startswith(b"[")
+    assert json_file_manager.get_vacancies() == [{"title": "Тестовая вакансия", "url": "test_url_1"}]
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".xz", ".bz2"])
+def test_csv_file_manager_compressed(tmpdir: Path, suffix: str) -> None:
+    """Тест чтения, записи и очистки сжатого CSV-файла."""
+    csv_file_manager = CSVFileManager(str(tmpdir / f"test_vacancies.csv{suffix}"))
+    csv_file_manager.add_vacancy({"title": "Test Vacancy", "url": "test_url"})
+    assert csv_file_manager.get_vacancies() == [{"title": "Test Vacancy", "url": "test_url"}]
+    csv_file_manager.clear_file()
+    assert csv_file_manager.get_vacancies() == []
+
+
+def test_open_file_detects_compression_by_magic_bytes(tmpdir: Path) -> None:
+    """Тест определения сжатия по сигнатуре файла без расширения."""
+    filename = str(tmpdir / "vacancies_archive")
+    with gzip.open(filename, "wt", encoding="utf-8") as f:
+        json.dump([{"title": "Test Vacancy", "url": "test_url"}], f)
+    with open_file(filename) as f:
+        assert json.load(f) == [{"title": "Test Vacancy", "url": "test_url"}]
+    assert JSONFileManager(filename).get_vacancies()[0]["url"] == "test_url"
+
+
+@pytest.mark.parametrize(
+    "suffix, content",
+    [(".gz", b"\x1f\x8b" + b"broken"), (".xz", b"\xfd7zXZ\x00broken"), (".bz2", b"BZh9broken")],
+)
+def test_json_file_manager_corrupted_compressed_file(tmpdir: Path, suffix: str, content: bytes) -> None:
+    """Тест обработки поврежденного сжатого JSON-файла."""
+    filename = str(tmpdir / f"test_vacancies.json{suffix}")
+    with open(filename, "wb") as f:
+        f.write(content)
+    assert JSONFileManager(filename).get_vacancies() == []
+    with pytest.raises(ValueError):
+        list(JSONFileManager(filename).iter_vacancies())
+
+
+def test_json_file_manager_io_error_is_not_empty_file(json_file_manager: JSONFileManager) -> None:
+    """Тест того, что ошибка ввода-вывода не выдается за пустой файл и не приводит к перезаписи архива."""
+    json_file_manager.add_vacancy({"title": "Test Vacancy", "url": "test_url"})
+    with patch("src.file_manager.open_file", side_effect=PermissionError(13, "Permission denied")):
+        with pytest.raises(PermissionError):
+            json_file_manager.add_vacancy({"title": "Test Vacancy 2", "url": "test_url_2"})
+        with pytest.raises(PermissionError):
+            list(json_file_manager.iter_vacancies())
+    assert len(json_file_manager.get_vacancies()) == 1
+
+
+def test_json_file_manager_does_not_overwrite_corrupted_file(json_file_manager: JSONFileManager) -> None:
+    """Тест того, что поврежденный JSON-файл не перезаписывается при добавлении и удалении вакансии."""
+    with open(json_file_manager.filename, "w", encoding="utf-8") as f:
+        f.write('[{"title": "Test Vacancy", "url": "test_url"}, {"ti')
+    with pytest.raises(ValueError):
+        json_file_manager.add_vacancy({"title": "Test Vacancy 2", "url": "test_url_2"})
+    with pytest.raises(ValueError):
+        json_file_manager.delete_vacancy("test_url")
+    with open(json_file_manager.filename, encoding="utf-8") as f:
+        assert f.read().endswith('{"ti')
+
+
+def test_csv_file_manager_truncated_compressed_file(tmpdir: Path) -> None:
+    """Тест того, что обрезанный .csv.gz читается как пустой, но не перезаписывается при добавлении вакансии."""
+    filename = str(tmpdir / "vacancies.csv.gz")
+    csv_file_manager = CSVFileManager(filename)
+    for number in range(100):
+        csv_file_manager.add_vacancy({"title": f"Test Vacancy {number}", "url": f"test_url_{number}"})
+    with open(filename, "rb") as f:
+        content = f.read()
+    with open(filename, "wb") as f:
+        f.write(content[: len(content) // 2])
+    assert csv_file_manager.get_vacancies() == []
+    with pytest.raises(ValueError):
+        csv_file_manager.add_vacancy({"title": "Test Vacancy", "url": "test_url"})
+    with pytest.raises(ValueError):
+        csv_file_manager.delete_vacancy("test_url_1")
+    with open(filename, "rb") as f:
+        assert f.read() == content[: len(content) // 2]
+
+
+def test_csv_file_manager_io_error_is_not_empty_file(csv_file_manager: CSVFileManager) -> None:
+    """Тест того, что ошибка ввода-вывода при чтении CSV-файла не выдается за пустой файл."""
+    csv_file_manager.add_vacancy({"title": "Test Vacancy", "url": "test_url"})
+    with patch("src.file_manager.open_file", side_effect=PermissionError(13, "Permission denied")):
+        with pytest.raises(PermissionError):
+            csv_file_manager.get_vacancies()
+        with pytest.raises(PermissionError):
+            csv_file_manager.add_vacancy({"title": "Test Vacancy 2", "url": "test_url_2"})
+        with pytest.raises(PermissionError):
+            list(csv_file_manager.iter_vacancies())
+    assert len(csv_file_manager.get_vacancies()) == 1
+
+
+# --- Тесты для потокового чтения и записи ---
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_iter_json_array(tmpdir: Path, chunk_size: int) -> None:
+    """Тест потокового разбора JSON-массива при разных размерах блока."""
+    filename = str(tmpdir / "array.json")
+    data = [{"title": "Тест [1]", "url": "u,1", "salary_from": 12345}, {"title": "B"}, 42]
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
+    with open(filename, encoding="utf-8") as f:
+        assert list(iter_json_array(f, chunk_size=chunk_size)) == data
+
+
+@pytest.mark.parametrize("content", ["", "{}", "[{}", '[{"a": '])
+def test_iter_json_array_invalid(tmpdir: Path, content: str) -> None:
+    """Тест ошибок потокового разбора JSON-массива."""
+    filename = str(tmpdir / "array.json")
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(content)
+    with open(filename, encoding="utf-8") as f:
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array(f, chunk_size=2))
+
+
+def test_json_file_manager_write_and_iter_vacancies(json_file_manager: JSONFileManager) -> None:
+    """Тест потоковой записи и чтения JSON-файла."""
+    vacancies = [{"title": f"Test Vacancy {i}", "url": f"test_url_{i}"} for i in range(3)]
+    assert json_file_manager.write_vacancies(iter(vacancies)) == 3
+    assert list(json_file_manager.iter_vacancies()) == vacancies
+    assert json_file_manager.get_vacancies() == vacancies
+    assert json_file_manager.write_vacancies([]) == 0
+    assert json_file_manager.get_vacancies() == []
+
+
+def test_json_file_manager_iter_missing_and_corrupted(json_file_manager: JSONFileManager) -> None:
+    """Тест потокового чтения отсутствующего и поврежденного JSON-файла: повреждение не скрывается."""
+    assert list(json_file_manager.iter_vacancies()) == []
+    with open(json_file_manager.filename, "w", encoding="utf-8") as f:
+        f.write('[{"title": "Test Vacancy", "url": "test_url"}, {"ti')
+    with pytest.raises(ValueError):
+        list(json_file_manager.iter_vacancies())
+
+
+def test_csv_file_manager_write_and_iter_vacancies(csv_file_manager: CSVFileManager) -> None:
+    """Тест потоковой записи и чтения CSV-файла."""
+    vacancies = [{"title": f"Test Vacancy {i}", "url": f"test_url_{i}"} for i in range(3)]
+    assert csv_file_manager.write_vacancies(vacancies) == 3
+    assert [{"title": v["title"], "url": v["url"]} for v in csv_file_manager.iter_vacancies()] == vacancies
+
+
+def test_csv_file_manager_write_mixed_fields(csv_file_manager: CSVFileManager) -> None:
+    """Тест потоковой записи вакансий с разным набором полей: поля не теряются молча."""
+    vacancies = [{"title": "Old", "url": "url1"}, {"title": "New", "url": "url2", "area": "1"}]
+    csv_file_manager.write_vacancies(vacancies)
+    assert [v["area"] for v in csv_file_manager.iter_vacancies()] == ["", "1"]
+    with pytest.raises(ValueError):
+        csv_file_manager.write_vacancies([{"title": "Old", "url": "url1"}, {"url": "url2", "unknown": "x"}])
+
+
+def test_operation_log_appends_and_compacts(tmpdir: Path) -> None:
+    state: Dict[str, int] = {}
+    log = OperationLog(str(tmpdir / "log.jsonl"), lambda: [{"id": k, "value": v} for k, v in state.items()])
+    assert list(log.replay()) == []
+    for i in range(OperationLog.COMPACT_MIN + 10):
+        state["a"] = i
+        log.append([{"id": "a", "value": i}], live=len(state))
+    assert log.size < OperationLog.COMPACT_MIN
+    records = list(log.replay())
+    assert records[-1] == {"id": "a", "value": OperationLog.COMPACT_MIN + 9}
+    assert log.size == len(records)
@@ -0,0 +1,123 @@
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.file_manager import JSONFileManager
+from src.history import VacancyHistory
+
+DAY_1 = datetime(2025, 1, 1)
+DAY_2 = datetime(2025, 1, 2)
+DAY_3 = datetime(2025, 1, 3)
+DAY_4 = datetime(2025, 1, 4)
+
+
+@pytest.fixture
+def history(tmpdir: Path) -> VacancyHistory:
+    """Фикстура для создания истории из трех сборов."""
+    history = VacancyHistory(str(tmpdir / "history.jsonl"), checkpoint_every=2)
+    vacancy = {"title": "Python", "url": "url1", "salary_from": 100, "salary_to": 200, "description": "a"}
+    history.record([vacancy], DAY_1)
+    history.record([{**vacancy, "salary_from": 150}], DAY_2)
+    history.record([{**vacancy, "salary_from": 150, "description": "b"}], DAY_3)
+    return history
+
+
+def test_history_records_only_changes(history: VacancyHistory) -> None:
+    """Тест того, что неизменные вакансии не увеличивают историю."""
+    size = os.path.getsize(history.filename)
+    written = history.record([history.state_as_of("url1", DAY_3) or {}], DAY_4)
+    assert written == 0
+    assert os.path.getsize(history.filename) == size
+
+
+def test_history_state_as_of(history: VacancyHistory) -> None:
+    """Тест восстановления состояния вакансии на дату."""
+    assert history.state_as_of("url1", datetime(2024, 12, 31)) is None
+    state = history.state_as_of("url1", DAY_2)
+    assert state is not None
+    assert state["salary_from"] == 150
+    assert state["description"] == "a"
+    state = history.state_as_of("url1", DAY_4)
+    assert state is not None
+    assert state["description"] == "b"
+    assert history.state_as_of("unknown", DAY_4) is None
+
+
+def test_history_salary_timeline(history: VacancyHistory) -> None:
+    """Тест истории зарплатной вилки (изменение описания не создает новую точку)."""
+    assert history.salary_timeline("url1") == [(DAY_1, 100, 200), (DAY_2, 150, 200)]
+
+
+def test_history_removal_and_snapshot(history: VacancyHistory) -> None:
+    """Тест удаления вакансии и среза всех вакансий на дату."""
+    history.record([{"title": "Java", "url": "url2", "salary_from": 300}], DAY_3)
+    history.record_removal("url1", DAY_4)
+    assert set(history.snapshot_as_of(DAY_3)) == {"url1", "url2"}
+    assert set(history.snapshot_as_of(DAY_4)) == {"url2"}
+
+
+def test_history_reload_from_file(history: VacancyHistory) -> None:
+    """Тест загрузки истории из файла."""
+    loaded = VacancyHistory(history.filename, checkpoint_every=2)
+    assert loaded.vacancy_ids == ["url1"]
+    assert loaded.state_as_of("url1", DAY_3) == history.state_as_of("url1", DAY_3)
+    assert loaded.salary_timeline("url1") == history.salary_timeline("url1")
+
+
+def test_history_checkpoints(tmpdir: Path) -> None:
+    """Тест периодической записи полного состояния."""
+    history = VacancyHistory(str(tmpdir / "history.jsonl"), checkpoint_every=2)
+    for day in range(1, 6):
+        history.record([{"url": "url1", "salary_from": day * 100}], datetime(2025, 1, day))
+    with open(history.filename, encoding="utf-8") as f:
+        types = [line.split('"type": "')[1].split('"')[0] for line in f]
+    assert types == ["checkpoint", "delta", "checkpoint", "delta", "checkpoint"]
+    assert (history.state_as_of("url1", datetime(2025, 1, 4)) or {})["salary_from"] == 400
+
+
+def test_history_out_of_order(history: VacancyHistory) -> None:
+    """Тест записи состояния с моментом раньше последней записи."""
+    with pytest.raises(ValueError):
+        history.record([{"url": "url1", "salary_from": 1}], DAY_1)
+
+
+def test_history_out_of_order_batch_is_not_applied(history: VacancyHistory) -> None:
+    """Тест того, что пакет с ошибкой не меняет историю ни в памяти, ни в файле."""
+    with pytest.raises(ValueError):
+        history.record([{"url": "url2", "salary_from": 1}, {"url": "url1", "salary_from": 1}], DAY_1)
+    assert history.vacancy_ids == ["url1"]
+    assert VacancyHistory(history.filename).vacancy_ids == ["url1"]
+
+
+def test_history_removed_fields(history: VacancyHistory) -> None:
+    """Тест того, что исчезнувшее в новом сборе поле не остается в состоянии вакансии."""
+    history.record([{"title": "Python", "url": "url1", "salary_from": 150, "salary_to": 200}], DAY_4)
+    state = history.state_as_of("url1", DAY_4) or {}
+    assert "description" not in state
+    assert (history.state_as_of("url1", DAY_3) or {})["description"] == "b"
+    loaded = VacancyHistory(history.filename, checkpoint_every=2)
+    assert loaded.state_as_of("url1", DAY_4) == state
+
+
+def test_history_maintained_by_file_manager(tmpdir: Path) -> None:
+    """Тест ведения истории при изменениях в JSON-хранилище."""
+    history = VacancyHistory(str(tmpdir / "history.jsonl"))
+    file_manager = JSONFileManager(str(tmpdir / "vacancies.json"), indexes=[history])
+    file_manager.add_vacancy({"title": "Python", "url": "url1", "salary_from": 100})
+    file_manager.delete_vacancy("url1")
+    file_manager.clear_file()
+    assert history.vacancy_ids == ["url1"]
+    assert history.snapshot_as_of(datetime.now()) == {}
+
+
+def test_history_records_changed_vacancy_saved_again(tmpdir: Path) -> None:
+    """Тест повторного сохранения изменившейся вакансии: хранилище заменяет запись, история видит изменение."""
+    history = VacancyHistory(str(tmpdir / "history.jsonl"))
+    file_manager = JSONFileManager(str(tmpdir / "vacancies.json"), indexes=[history])
+    file_manager.add_vacancy({"title": "Python", "url": "u1", "salary_from": 100})
+    file_manager.add_vacancy({"title": "Python", "url": "u1", "salary_from": 100})
+    file_manager.add_vacancy({"title": "Python", "url": "u1", "salary_from": 200})
+    assert [point[1] for point in history.salary_timeline("u1")] == [100, 200]
+    assert file_manager.get_vacancies() == [{"title": "Python", "url": "u1", "salary_from": 200}]
@@ -0,0 +1,188 @@
+import json
+import os
+from datetime import date
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from src.partitioned_store import PartitionedFileManager
+from src.query import Area, Keyword, SalaryBetween, search_vacancies
+from src.salary_index import SalaryIndex
+from src.utils import load_vacancies_from_file, save_vacancies_to_file
+from src.vacancy import Vacancy
+
+
+@pytest.fixture
+def vacancies() -> List[Dict]:
+    """Фикстура для создания списка вакансий из двух регионов."""
+    return [
+        {"title": "Python", "url": "url1", "salary_from": 100000, "salary_to": 200000, "area": "1"},
+        {"title": "Java", "url": "url2", "salary_from": 300000, "salary_to": 0, "area": "1"},
+        {"title": "Go", "url": "url3", "salary_from": 0, "salary_to": 0, "area": "2"},
+        {"title": "Python", "url": "url4", "salary_from": 50000, "salary_to": 0, "area": "2"},
+    ]
+
+
+@pytest.fixture
+def store(tmpdir: Path, vacancies: List[Dict]) -> PartitionedFileManager:
+    """Фикстура для создания хранилища, разбитого по региону и дате."""
+    store = PartitionedFileManager(str(tmpdir / "partitions"), today=lambda: date(2025, 1, 1))
+    for vacancy in vacancies:
+        store.add_vacancy(vacancy)
+    return store
+
+
+def test_partitioned_store_manifest(store: PartitionedFileManager) -> None:
+    """Тест записи статистики партиций в манифест."""
+    partitions = store.partitions
+    assert sorted(partitions) == ["area_1_2025-01-01", "area_2_2025-01-01"]
+    assert partitions["area_1_2025-01-01"]["rows"] == 2
+    assert partitions["area_1_2025-01-01"]["salary_min"] == 150000
+    assert partitions["area_1_2025-01-01"]["salary_max"] == 300000
+    assert partitions["area_2_2025-01-01"]["salary_min"] == 50000
+    assert os.path.exists(os.path.join(store.directory, "manifest.json"))
+
+
+def test_partitioned_store_file_manager_interface(store: PartitionedFileManager, vacancies: List[Dict]) -> None:
+    """Тест добавления, дублирования, удаления и очистки."""
+    store.add_vacancy(vacancies[0])
+    assert len(store.get_vacancies()) == 4
+    store.delete_vacancy("url3")
+    assert [v["url"] for v in store.get_vacancies()] == ["url1", "url2", "url4"]
+    store.delete_vacancy("url4")
+    assert list(store.partitions) == ["area_1_2025-01-01"]
+    store.clear_file()
+    assert store.get_vacancies() == []
+    assert sorted(os.listdir(store.directory)) == ["locations.jsonl", "manifest.json"]
+
+
+def test_partitioned_store_reload(store: PartitionedFileManager) -> None:
+    """Тест открытия существующего каталога с партициями."""
+    reopened = PartitionedFileManager(store.directory)
+    assert len(reopened.get_vacancies()) == 4
+    with pytest.raises(ValueError):
+        PartitionedFileManager(store.directory, partition_by="hash")
+
+
+def test_partitioned_store_pruning(store: PartitionedFileManager) -> None:
+    """Тест отсечения партиций по региону и диапазону зарплат."""
+    with patch.object(store, "_read_partition", wraps=store._read_partition) as read_partition:
+        result = search_vacancies(store, SalaryBetween(200000, None) & Keyword("java"))
+        assert [v.url for v in result] == ["url2"]
+        read_partition.assert_called_once_with("area_1_2025-01-01")
+
+        read_partition.reset_mock()
+        result = search_vacancies(store, Area("2") & Keyword("python"))
+        assert [v.url for v in result] == ["url4"]
+        read_partition.assert_called_once_with("area_2_2025-01-01")
+
+        read_partition.reset_mock()
+        assert store.get_candidates(salary_range=(400000, None)) == []
+        read_partition.assert_not_called()
+
+
+def test_partitioned_store_hash(tmpdir: Path, vacancies: List[Dict]) -> None:
+    """Тест разбиения по хешу url и обновления индексов."""
+    index = SalaryIndex()
+    store = PartitionedFileManager(str(tmpdir / "hashed"), partition_by="hash", num_buckets=4, indexes=[index])
+    for vacancy in vacancies:
+        store.add_vacancy(vacancy)
+    assert sum(info["rows"] for info in store.partitions.values()) == 4
+    assert all(name.startswith("bucket_") for name in store.partitions)
+    store.delete_vacancy("url1")
+    assert "url1" not in index
+    assert len(store.get_vacancies()) == 3
+    with pytest.raises(ValueError):
+        PartitionedFileManager(str(tmpdir / "hashed"), partition_by="hash", num_buckets=8)
+
+
+def test_partitioned_store_unknown_mode(tmpdir: Path) -> None:
+    """Тест неизвестного способа разбиения."""
+    with pytest.raises(ValueError):
+        PartitionedFileManager(str(tmpdir), partition_by="month")
+
+
+def test_partitioned_store_compression(tmpdir: Path, vacancies: List[Dict]) -> None:
+    """Тест хранения партиций в сжатом виде."""
+    store = PartitionedFileManager(str(tmpdir / "compressed"), compression=".gz")
+    for vacancy in vacancies:
+        store.add_vacancy(vacancy)
+    assert all(info["file"].endswith(".json.gz") for info in store.partitions.values())
+    assert len(PartitionedFileManager(store.directory).get_vacancies()) == 4
+
+
+def test_partitioned_store_deduplicates_across_days(tmpdir: Path, vacancies: List[Dict]) -> None:
+    """Тест повторного сбора вакансии на следующий день: она остается в одной партиции, как в JSONFileManager."""
+    directory = str(tmpdir / "partitions")
+    PartitionedFileManager(directory, today=lambda: date(2025, 1, 1)).add_vacancy(vacancies[0])
+    next_day = PartitionedFileManager(directory, today=lambda: date(2025, 1, 2))
+    next_day.add_vacancy(vacancies[0])
+    assert len(next_day.get_vacancies()) == 1
+    assert next_day.count_vacancies() == 1
+    next_day.delete_vacancy("url1")
+    assert next_day.get_vacancies() == []
+
+
+def test_partitioned_store_moves_changed_vacancy(tmpdir: Path, vacancies: List[Dict]) -> None:
+    """Тест повторного сбора изменившейся вакансии: она переносится в партицию текущего сбора."""
+    directory = str(tmpdir / "partitions")
+    PartitionedFileManager(directory, today=lambda: date(2025, 1, 1)).add_vacancy(vacancies[0])
+    next_day = PartitionedFileManager(directory, today=lambda: date(2025, 1, 2))
+    next_day.add_vacancy({**vacancies[0], "salary_from": 999})
+    assert [v["salary_from"] for v in next_day.get_vacancies()] == [999]
+    assert [name.endswith("2025-01-02") for name in next_day.partitions] == [True]
+
+
+def test_partitioned_store_locations_log(store: PartitionedFileManager, vacancies: List[Dict]) -> None:
+    """Тест хранения карты вакансий в журнале: манифест хранит только статистику партиций."""
+    with open(os.path.join(store.directory, "manifest.json"), encoding="utf-8") as f:
+        assert "locations" not in json.load(f)
+    with open(os.path.join(store.directory, "locations.jsonl"), encoding="utf-8") as f:
+        assert len(f.readlines()) == 4
+    store.delete_vacancy("url1")
+    reloaded = PartitionedFileManager(store.directory, today=lambda: date(2025, 1, 2))
+    reloaded.add_vacancy(vacancies[1])
+    reloaded.add_vacancy(vacancies[0])
+    assert sorted(v["url"] for v in reloaded.get_vacancies()) == ["url1", "url2", "url3", "url4"]
+
+
+def test_partitioned_store_legacy_manifest(store: PartitionedFileManager, vacancies: List[Dict]) -> None:
+    """Тест переноса карты вакансий из манифеста прежнего формата в журнал."""
+    manifest = os.path.join(store.directory, "manifest.json")
+    with open(manifest, encoding="utf-8") as f:
+        data = json.load(f)
+    data["locations"] = {v["url"]: f"area_{v['area']}_2025-01-01" for v in vacancies}
+    with open(manifest, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.remove(os.path.join(store.directory, "locations.jsonl"))
+    next_day = PartitionedFileManager(store.directory, today=lambda: date(2025, 1, 2))
+    with open(manifest, encoding="utf-8") as f:
+        assert "locations" not in json.load(f)
+    next_day.add_vacancy(vacancies[0])
+    assert next_day.count_vacancies() == 4
+
+
+def test_partitioned_store_does_not_overwrite_corrupted_partition(
+    store: PartitionedFileManager, vacancies: List[Dict]
+) -> None:
+    """Тест того, что поврежденная партиция не перезаписывается при добавлении вакансии."""
+    path = os.path.join(store.directory, store.partitions["area_1_2025-01-01"]["file"])
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('[{"title": "Python", "url": "ur')
+    assert [v["url"] for v in store.get_vacancies()] == ["url3", "url4"]
+    with pytest.raises(ValueError):
+        store.add_vacancy({**vacancies[1], "url": "url5"})
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == '[{"title": "Python", "url": "ur'
+
+
+def test_partitioned_store_with_utils(tmpdir: Path) -> None:
+    """Тест сохранения и загрузки вакансий функциями utils через PartitionedFileManager."""
+    store = PartitionedFileManager(str(tmpdir / "partitions"), partition_by="hash", num_buckets=4)
+    vacancies = [Vacancy("Python", "url1", 100000, 0, area="1"), Vacancy("Go", "url2", 0, 200000, area="2")]
+    save_vacancies_to_file(vacancies, store)
+    save_vacancies_to_file(vacancies, store)
+    loaded = load_vacancies_from_file(store)
+    assert sorted(vacancy.url for vacancy in loaded) == ["url1", "url2"]
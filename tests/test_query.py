@@ -0,0 +1,154 @@
+from pathlib import Path
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.file_manager import CSVFileManager, FileManager, JSONFileManager
+from src.query import (
+    AllOf,
+    AnyOf,
+    Area,
+    Keyword,
+    MatchAll,
+    Not,
+    SalaryBetween,
+    TitleRegex,
+    filter_vacancies,
+    parse_query,
+    search_vacancies,
+)
+from src.salary_index import SalaryIndex
+from src.vacancy import Vacancy
+
+
+@pytest.fixture
+def vacancies() -> List[Vacancy]:
+    """Фикстура для создания списка вакансий."""
+    return [
+        Vacancy("Python Developer", "url1", 100000, 150000, "Django, Flask", area="1"),
+        Vacancy("Java Developer", "url2", 200000, 0, "Spring", area="2"),
+        Vacancy("Senior Python Engineer", "url3", 0, 300000, "FastAPI", area="1"),
+        Vacancy("Тестировщик", "url4", 0, 0, "Python для автотестов", area="2"),
+    ]
+
+
+def _urls(vacancies: List[Vacancy]) -> List[str]:
+    return [vacancy.url for vacancy in vacancies]
+
+
+def test_keyword_and_or_not(vacancies: List[Vacancy]) -> None:
+    """Тест комбинирования ключевых слов через операторы."""
+    query = Keyword("python") & ~Keyword("fastapi")
+    assert _urls(list(filter_vacancies(vacancies, query))) == ["url1", "url4"]
+    query = Keyword("spring") | Keyword("flask")
+    assert _urls(list(filter_vacancies(vacancies, query))) == ["url1", "url2"]
+
+
+def test_keyword_fields(vacancies: List[Vacancy]) -> None:
+    """Тест поиска ключевого слова только в описании."""
+    query = Keyword("python", fields=("description",))
+    assert _urls(list(filter_vacancies(vacancies, query))) == ["url4"]
+
+
+def test_salary_title_regex_and_area(vacancies: List[Vacancy]) -> None:
+    """Тест фильтрации по зарплате, регулярному выражению и региону."""
+    assert _urls(list(filter_vacancies(vacancies, SalaryBetween(120000, 250000)))) == ["url1", "url2"]
+    assert _urls(list(filter_vacancies(vacancies, TitleRegex(r"^(senior )?python")))) == ["url1", "url3"]
+    assert _urls(list(filter_vacancies(vacancies, Area("2")))) == ["url2", "url4"]
+    assert len(list(filter_vacancies(vacancies, MatchAll()))) == 4
+
+
+def test_filter_vacancies_single_pass() -> None:
+    """Тест того, что предикат вычисляется за один проход по потоку."""
+    stream = MagicMock()
+    stream.__iter__.return_value = iter([Vacancy("Python", "url1")])
+    result = list(filter_vacancies(stream, Keyword("python") & Not(Keyword("java"))))
+    assert _urls(result) == ["url1"]
+    stream.__iter__.assert_called_once()
+
+
+def test_pushdown_hints() -> None:
+    """Тест вычисления ограничений, передаваемых в индексы."""
+    query = SalaryBetween(100, 500) & SalaryBetween(200, None) & Area("1", "2") & Area("2")
+    assert query.salary_range() == (200, 500)
+    assert query.areas() == {"2"}
+    assert (SalaryBetween(100, 200) | SalaryBetween(300, 400)).salary_range() == (100, 400)
+    assert (SalaryBetween(100, 200) | Keyword("python")).salary_range() is None
+    assert Not(SalaryBetween(100, 200)).salary_range() is None
+    assert isinstance(Keyword("a") & Keyword("b") & Keyword("c"), AllOf)
+    assert len(AllOf(Keyword("a") & Keyword("b"), Keyword("c")).queries) == 3
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("python", ["url1", "url3", "url4"]),
+        ("python NOT fastapi", ["url1", "url4"]),
+        ("python AND (django OR автотест)", ["url1", "url4"]),
+        ("spring OR flask", ["url1", "url2"]),
+        ("salary:120000..250000", ["url1", "url2"]),
+        ("salary:250000..", ["url3"]),
+        ("title:/^java/ OR area:1", ["url1", "url2", "url3"]),
+        ('"python developer"', ["url1"]),
+        ("", ["url1", "url2", "url3", "url4"]),
+    ],
+)
+def test_parse_query(vacancies: List[Vacancy], text: str, expected: List[str]) -> None:
+    """Параметризованный тест разбора строки запроса."""
+    assert _urls(list(filter_vacancies(vacancies, parse_query(text)))) == expected
+
+
+@pytest.mark.parametrize("text", ["(python", "python OR", "AND python", "salary:100", "python )"])
+def test_parse_query_errors(text: str) -> None:
+    """Тест ошибок разбора строки запроса."""
+    with pytest.raises(ValueError):
+        parse_query(text)
+
+
+def test_parse_query_structure() -> None:
+    """Тест структуры разобранного запроса."""
+    query = parse_query("a OR b c")
+    assert isinstance(query, AnyOf)
+    assert isinstance(query.queries[1], AllOf)
+
+
+def test_search_vacancies_uses_salary_index(tmpdir: Path, vacancies: List[Vacancy]) -> None:
+    """Тест передачи ограничения по зарплате в индекс хранилища."""
+    index = SalaryIndex()
+    file_manager = JSONFileManager(str(tmpdir / "vacancies.json"), indexes=[index])
+    for vacancy in vacancies:
+        file_manager.add_vacancy(dict(vacancy))
+    index.candidate_ids = MagicMock(wraps=index.candidate_ids)  # type: ignore
+    result = search_vacancies(file_manager, SalaryBetween(120000, 250000) & Keyword("developer"))
+    assert _urls(result) == ["url1", "url2"]
+    index.candidate_ids.assert_called_once_with((120000, 250000))
+
+
+@pytest.mark.parametrize("with_index", [False, True])
+def test_search_vacancies_csv_store(tmpdir: Path, vacancies: List[Vacancy], with_index: bool) -> None:
+    """Тест поиска по зарплате в CSV-хранилище, где зарплаты хранятся строками."""
+    file_manager = CSVFileManager(str(tmpdir / "vacancies.csv"), indexes=[SalaryIndex()] if with_index else None)
+    for vacancy in vacancies:
+        file_manager.add_vacancy(dict(vacancy))
+    result = search_vacancies(file_manager, SalaryBetween(120000, 250000))
+    assert _urls(result) == ["url1", "url2"]
+    assert result[0].salary_from == 100000
+
+
+def test_search_vacancies_rebuilds_stale_index(tmpdir: Path, vacancies: List[Vacancy]) -> None:
+    """Тест подключения пустого индекса к уже заполненному хранилищу."""
+    filename = str(tmpdir / "vacancies.json")
+    JSONFileManager(filename).write_vacancies(dict(vacancy) for vacancy in vacancies)
+    index = SalaryIndex()
+    file_manager = JSONFileManager(filename, indexes=[index])
+    assert _urls(search_vacancies(file_manager, SalaryBetween(120000, 250000))) == ["url1", "url2"]
+    assert len(index) == 4
+
+
+def test_get_candidates_filters_areas(tmpdir: Path, vacancies: List[Vacancy]) -> None:
+    """Тест ограничения выборки хранилища по регионам."""
+    file_manager: FileManager = JSONFileManager(str(tmpdir / "vacancies.json"))
+    file_manager.write_vacancies(dict(vacancy) for vacancy in vacancies)
+    assert [v["url"] for v in file_manager.get_candidates(areas={"2"})] == ["url2", "url4"]
+    assert _urls(search_vacancies(file_manager, Area("1") & Keyword("python"))) == ["url1", "url3"]
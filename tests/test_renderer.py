@@ -0,0 +1,93 @@
+import csv
+import gzip
+import io
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src.renderer import export_vacancies, render_vacancies
+from src.vacancy import Vacancy
+
+
+@pytest.fixture
+def vacancies() -> List[Vacancy]:
+    """Фикстура для создания списка вакансий."""
+    return [
+        Vacancy("Python Developer", "url1", 100000, 150000, "Django,\tFlask", area="1"),
+        Vacancy("Очень длинное название вакансии " * 5, "url2", 0, 200000, 'Текст с "кавычками"'),
+        Vacancy("Go Developer", "url3", 300000, 0, ""),
+    ]
+
+
+def test_render_text_matches_display_format(vacancies: List[Vacancy]) -> None:
+    """Тест удобочитаемого формата."""
+    out = io.StringIO()
+    assert render_vacancies(vacancies[:1], out=out) == 1
+    assert out.getvalue() == (
+        "Название: Python Developer\nСсылка: url1\nЗарплата: 100000 - 150000\n"
+        "Описание: Django,\tFlask\n--------------------\n"
+    )
+
+
+def test_render_writes_in_batches(vacancies: List[Vacancy]) -> None:
+    """Тест записи пакетами одной операцией на пакет."""
+
+    class CountingIO(io.StringIO):
+        writes = 0
+
+        def write(self, s: str) -> int:
+            self.writes += 1
+            return super().write(s)
+
+    out = CountingIO()
+    assert render_vacancies(vacancies * 10, fmt="jsonl", out=out, batch_size=8) == 30
+    assert out.writes == 4
+
+
+@pytest.mark.parametrize("fmt, delimiter", [("csv", ","), ("tsv", "\t")])
+def test_render_delimited(vacancies: List[Vacancy], fmt: str, delimiter: str) -> None:
+    """Тест форматов CSV и TSV с выбором колонок."""
+    out = io.StringIO()
+    render_vacancies(vacancies, fmt=fmt, columns=["url", "salary", "description"], out=out, batch_size=2)
+    rows = list(csv.reader(io.StringIO(out.getvalue()), delimiter=delimiter))
+    assert rows[0] == ["url", "salary", "description"]
+    assert rows[1] == ["url1", "100000 - 150000", "Django,\tFlask"]
+    assert rows[2][2] == 'Текст с "кавычками"'
+    assert len(rows) == 4
+
+
+def test_render_jsonl_paging(vacancies: List[Vacancy]) -> None:
+    """Тест формата JSON Lines и вывода страницы результатов."""
+    out = io.StringIO()
+    assert render_vacancies(vacancies, fmt="jsonl", out=out, offset=1, limit=1) == 1
+    row = json.loads(out.getvalue())
+    assert row["url"] == "url2"
+    assert set(row) == {"title", "url", "salary_from", "salary_to", "description", "area"}
+
+
+def test_render_table(vacancies: List[Vacancy]) -> None:
+    """Тест выровненной таблицы с обрезкой длинных значений."""
+    out = io.StringIO()
+    render_vacancies(vacancies, fmt="table", out=out, batch_size=1)
+    lines = out.getvalue().splitlines()
+    assert lines[0].startswith("Название")
+    assert set(lines[1]) <= {"-", "+"}
+    assert lines[3].index("|") == lines[2].index("|")
+    assert "…" in lines[3]
+
+
+def test_render_unknown_format(vacancies: List[Vacancy]) -> None:
+    """Тест неизвестного формата вывода."""
+    with pytest.raises(ValueError):
+        render_vacancies(vacancies, fmt="xml")
+
+
+def test_export_vacancies_compressed(tmpdir: Path, vacancies: List[Vacancy]) -> None:
+    """Тест записи вакансий в сжатый файл."""
+    filename = str(tmpdir / "vacancies.csv.gz")
+    assert export_vacancies(vacancies, filename, fmt="csv") == 3
+    with gzip.open(filename, "rt", encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["url"] for row in rows] == ["url1", "url2", "url3"]
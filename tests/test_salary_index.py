@@ -0,0 +1,116 @@
+from pathlib import Path
+
+import pytest
+
+from src.file_manager import CSVFileManager, JSONFileManager, OperationLog
+from src.salary_index import SalaryIndex, parse_salary, salary_midpoint
+
+
+@pytest.fixture
+def salary_index(tmpdir: Path) -> SalaryIndex:
+    """Фикстура для создания индекса с несколькими вакансиями."""
+    index = SalaryIndex(str(tmpdir / "salary_index.jsonl"))
+    index.add({"url": "a", "salary_from": 50000, "salary_to": 70000})
+    index.add({"url": "b", "salary_from": 100000, "salary_to": 0})
+    index.add({"url": "c", "salary_from": 0, "salary_to": 90000})
+    index.add({"url": "d", "salary_from": 0, "salary_to": 0})
+    return index
+
+
+def test_salary_midpoint() -> None:
+    """Тест нормализации середины вилки при неизвестной границе."""
+    assert salary_midpoint(100, 200) == 150
+    assert salary_midpoint(100, 0) == 100
+    assert salary_midpoint(0, 200) == 200
+    assert salary_midpoint(0, 0) is None
+
+
+def test_parse_salary() -> None:
+    """Тест приведения значений зарплаты, в том числе строк из CSV."""
+    assert parse_salary("100000") == 100000
+    assert parse_salary("") == 0
+    assert parse_salary(None) == 0
+
+
+def test_salary_index_range_queries(salary_index: SalaryIndex) -> None:
+    """Тест запросов по диапазону и порогу с учетом неизвестных границ."""
+    assert salary_index.salary_between(55000, 95000) == ["a", "c"]
+    assert salary_index.salary_from_at_least(60000) == ["b"]
+    assert salary_index.salary_to_at_most(80000) == ["a"]
+    assert salary_index.query("salary_from") == ["a", "b"]
+    assert len(salary_index) == 4
+
+
+def test_salary_index_unknown_field(salary_index: SalaryIndex) -> None:
+    """Тест запроса по неизвестному полю."""
+    with pytest.raises(ValueError):
+        salary_index.query("salary")
+
+
+def test_salary_index_replace_and_remove(salary_index: SalaryIndex) -> None:
+    """Тест замены и удаления вакансии в индексе."""
+    salary_index.add({"url": "a", "salary_from": 200000, "salary_to": 0})
+    assert salary_index.salary_from_at_least(150000) == ["a"]
+    salary_index.remove("a")
+    assert "a" not in salary_index
+    assert salary_index.salary_between() == ["c", "b"]
+
+
+def test_salary_index_persistence(salary_index: SalaryIndex) -> None:
+    """Тест загрузки индекса из файла."""
+    loaded = SalaryIndex(salary_index.filename)
+    assert loaded.salary_between(55000, 95000) == ["a", "c"]
+    assert len(loaded) == 4
+
+
+def test_salary_index_appends_operations(salary_index: SalaryIndex) -> None:
+    """Тест журнала операций: изменения дописываются в файл, а не переписывают его целиком."""
+    salary_index.remove("a")
+    salary_index.add({"url": "b", "salary_from": 120000, "salary_to": 0})
+    with open(str(salary_index.filename), encoding="utf-8") as f:
+        assert len(f.readlines()) == 6
+    loaded = SalaryIndex(salary_index.filename)
+    assert "a" not in loaded
+    assert loaded.salary_from_at_least(110000) == ["b"]
+
+
+def test_salary_index_compacts_log(tmpdir: Path) -> None:
+    """Тест сжатия журнала, когда он становится намного длиннее индекса."""
+    filename = str(tmpdir / "salary_index.jsonl")
+    index = SalaryIndex(filename)
+    for _ in range(OperationLog.COMPACT_MIN + 10):
+        index.add({"url": "a", "salary_from": 100, "salary_to": 200})
+    with open(filename, encoding="utf-8") as f:
+        assert len(f.readlines()) < OperationLog.COMPACT_MIN
+    assert SalaryIndex(filename).salary_between(150, 150) == ["a"]
+
+
+def test_salary_index_rebuild() -> None:
+    """Тест перестроения индекса по данным хранилища."""
+    index = SalaryIndex()
+    index.rebuild([{"url": "x", "salary_from": "100", "salary_to": "300"}, {"url": "y", "salary_from": 10}])
+    assert index.salary_between(150, 250) == ["x"]
+
+
+def test_json_file_manager_maintains_index(tmpdir: Path) -> None:
+    """Тест обновления индекса JSONFileManager при добавлении, удалении и очистке."""
+    index = SalaryIndex()
+    file_manager = JSONFileManager(str(tmpdir / "vacancies.json"), indexes=[index])
+    file_manager.add_vacancy({"title": "A", "url": "a", "salary_from": 100, "salary_to": 200})
+    file_manager.add_vacancy({"title": "B", "url": "b", "salary_from": 300, "salary_to": 0})
+    assert index.salary_between(100, 200) == ["a"]
+    file_manager.delete_vacancy("a")
+    assert index.salary_between() == ["b"]
+    file_manager.clear_file()
+    assert len(index) == 0
+
+
+def test_csv_file_manager_maintains_index(tmpdir: Path) -> None:
+    """Тест обновления индекса CSVFileManager при добавлении и удалении."""
+    index = SalaryIndex()
+    file_manager = CSVFileManager(str(tmpdir / "vacancies.csv"), indexes=[index])
+    file_manager.add_vacancy({"title": "A", "url": "a", "salary_from": 100, "salary_to": 200})
+    file_manager.add_vacancy({"title": "B", "url": "b", "salary_from": 300, "salary_to": 0})
+    assert index.salary_from_at_least(150) == ["b"]
+    file_manager.delete_vacancy("b")
+    assert index.salary_from_at_least(150) == []
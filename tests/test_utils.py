@@ -111,10 +111,10 @@ def test_save_vacancies_to_file_success(
     assert f"Сохранено 1 вакансий в {filename_str}" in captured.out
 
 
-@patch("src.utils.JSONFileManager.get_vacancies")
-def test_load_vacancies_from_file_success(mock_get_vacancies: MagicMock, sample_vacancy: Dict[str, Any]) -> None:
+@patch("src.utils.JSONFileManager.iter_vacancies")
+def test_load_vacancies_from_file_success(mock_iter_vacancies: MagicMock, sample_vacancy: Dict[str, Any]) -> None:
     """Тест успешной загрузки вакансий из файла."""
-    mock_get_vacancies.return_value = [dict(sample_vacancy)]
+    mock_iter_vacancies.return_value = iter([dict(sample_vacancy)])
     vacancies = load_vacancies_from_file("test_vacancies.json")
     assert len(vacancies) == 1
     assert isinstance(vacancies[0], Vacancy)
@@ -130,3 +130,22 @@ def test_load_vacancies_from_file_empty_file(tmpdir: Path) -> None:
 
     vacancies: List[Vacancy] = load_vacancies_from_file(filename_str)
     assert len(vacancies) == 0
+
+
+def test_save_and_load_compressed_file(tmpdir: Path, sample_vacancy: Vacancy) -> None:
+    """Тест сохранения и загрузки вакансий из сжатого файла."""
+    filename_str: str = str(tmpdir / "test_vacancies.json.xz")
+    save_vacancies_to_file([sample_vacancy], filename_str)
+    vacancies = load_vacancies_from_file(filename_str)
+    assert len(vacancies) == 1
+    assert vacancies[0].url == sample_vacancy.url
+
+
+def test_save_vacancies_to_existing_archive(tmpdir: Path, sample_vacancy: Vacancy) -> None:
+    """Тест повторного сохранения вакансии в архив, записанный до появления поля area."""
+    filename_str: str = str(tmpdir / "test_vacancies.json")
+    old_record = {key: value for key, value in dict(sample_vacancy).items() if key != "area"}
+    with open(filename_str, "w", encoding="utf-8") as f:
+        json.dump([old_record], f)
+    save_vacancies_to_file([sample_vacancy], filename_str)
+    assert len(load_vacancies_from_file(filename_str)) == 1